@@ -7,6 +7,8 @@ from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
 from django.shortcuts import get_object_or_404
 
+from news_backend.serialization import compiled
+
 from .models import Author
 from .serializers import AuthorSerializer
 
@@ -24,6 +26,8 @@ class StandardResultsSetPagination(PageNumberPagination):
 # List Authors (paginated + optional search)
 # -----------------------------------------------------------
 class AuthorListAPI(APIView):
+    use_replica = True
+
     def get(self, request):
         qs = Author.objects.all().order_by("name")
 
@@ -34,26 +38,26 @@ class AuthorListAPI(APIView):
 
         paginator = StandardResultsSetPagination()
         page = paginator.paginate_queryset(qs, request)
-        serializer = AuthorSerializer(page, many=True, context={"request": request})
-
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response(compiled(AuthorSerializer).many(page))
 
 
 # -----------------------------------------------------------
 # Author Detail (by ID)
 # -----------------------------------------------------------
 class AuthorDetailAPI(APIView):
+    use_replica = True
+
     def get(self, request, pk):
         obj = get_object_or_404(Author, pk=pk)
-        serializer = AuthorSerializer(obj, context={"request": request})
-        return Response(serializer.data)
+        return Response(compiled(AuthorSerializer)(obj))
 
 
 # -----------------------------------------------------------
 # Author Detail (SEO-friendly slug)
 # -----------------------------------------------------------
 class AuthorDetailBySlugAPI(APIView):
+    use_replica = True
+
     def get(self, request, slug):
         obj = get_object_or_404(Author, slug=slug)
-        serializer = AuthorSerializer(obj, context={"request": request})
-        return Response(serializer.data)
+        return Response(compiled(AuthorSerializer)(obj))
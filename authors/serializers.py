@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from news_backend.media import media_url
 from .models import Author
 
 class AuthorSerializer(serializers.ModelSerializer):
@@ -14,9 +15,4 @@ class AuthorSerializer(serializers.ModelSerializer):
         ]
 
     def get_photo_url(self, obj):
-        if obj.photo:
-            try:
-                return obj.photo.url
-            except:
-                return None
-        return None
+        return media_url(obj.photo)
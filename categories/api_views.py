@@ -6,20 +6,52 @@ Clean, consistent, and ready for frontend integration.
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.db.models import Count, Max, Q
+
+from news_backend.cache import cached_response
+from news_backend.conditional import conditional_get
+from news_backend.serialization import compiled
 
 from .models import Category
 from .serializers import CategorySerializer
 
 
+def category_list_state(request):
+    # updated_at also moves with published_count (Category.adjust_published_counts)
+    state = Category.objects.aggregate(modified=Max("updated_at"), count=Count("id"))
+    return (state["count"], state["modified"]), state["modified"]
+
+
+def category_state(request, slug):
+    modified = (
+        Category.objects.filter(slug=slug)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+    if modified is None:
+        return None
+    return modified, modified
+
+
 class CategoryListAPI(APIView):
     """
     Return all categories.
     Endpoint: /api/categories/
     """
+    query_budget = 2
+    use_replica = True
+
+    @conditional_get(category_list_state)
+    @cached_response("categories")
     def get(self, request):
-        qs = Category.objects.all().order_by("name")
-        serializer = CategorySerializer(qs, many=True, context={"request": request})
-        return Response(serializer.data)
+        qs = (
+            Category.objects
+            .annotate(published_articles=Count(
+                "articles", filter=Q(articles__status="published")
+            ))
+            .order_by("name")
+        )
+        return Response(compiled(CategorySerializer).many(qs))
 
 
 class CategoryDetailAPI(APIView):
@@ -27,7 +59,11 @@ class CategoryDetailAPI(APIView):
     Return a specific category by slug.
     Endpoint: /api/categories/<slug>/
     """
+    query_budget = 2
+    use_replica = True
+
+    @conditional_get(category_state)
+    @cached_response("categories")
     def get(self, request, slug):
         obj = get_object_or_404(Category, slug=slug)
-        serializer = CategorySerializer(obj, context={"request": request})
-        return Response(serializer.data)
+        return Response(compiled(CategorySerializer)(obj))
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.11 on 2026-10-18 10:40
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_published_count(apps, schema_editor):
+    Category = apps.get_model("categories", "Category")
+    NewsArticle = apps.get_model("news", "NewsArticle")
+
+    published = (
+        NewsArticle.objects
+        .filter(category=OuterRef("pk"), status="published")
+        .order_by()
+        .values("category")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Category.objects.update(published_count=Coalesce(Subquery(published), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0001_initial'),
+        ('news', '0006_newsarticle_public_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='published_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_published_count, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,7 @@
 from django.db import models
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
 from django.utils.text import slugify
 
 
@@ -7,6 +10,13 @@ class Category(models.Model):
     slug = models.SlugField(max_length=220, unique=True, blank=True)
     description = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Also bumped when published_count moves, so it validates the
+    # category responses (news_backend/conditional.py).
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Denormalized number of published articles, maintained by the news
+    # signals (news/signals.py) so no read path has to COUNT(*).
+    published_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ["name"]
@@ -18,3 +28,36 @@ class Category(models.Model):
 
     def __str__(self):
         return self.name
+
+    @classmethod
+    def adjust_published_counts(cls, deltas):
+        """
+        Apply ``{category_id: delta}`` to the published counters.
+        """
+        for category_id, delta in deltas.items():
+            if category_id is None or not delta:
+                continue
+            cls.objects.filter(pk=category_id).update(
+                published_count=Greatest(F("published_count") + delta, Value(0)),
+                updated_at=timezone.now(),
+            )
+
+    @classmethod
+    def recount_published(cls):
+        """
+        Recompute every published counter from the articles table, for
+        bulk writes that bypassed the signals.
+        """
+        NewsArticle = cls._meta.get_field("articles").related_model
+        published = (
+            NewsArticle.objects
+            .filter(category=OuterRef("pk"), status="published")
+            .order_by()
+            .values("category")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        cls.objects.update(
+            published_count=Coalesce(Subquery(published), 0),
+            updated_at=timezone.now(),
+        )
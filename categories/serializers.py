@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from .models import Category
 
+
 class CategorySerializer(serializers.ModelSerializer):
-    article_count = serializers.IntegerField(source="articles.count", read_only=True)
+    article_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Category
@@ -13,3 +14,24 @@ class CategorySerializer(serializers.ModelSerializer):
             "description",
             "article_count",
         ]
+
+    def get_article_count(self, obj):
+        # CategoryListAPI annotates an exact count in its single query;
+        # everywhere else the denormalized counter is read as-is.
+        annotated = getattr(obj, "published_articles", None)
+        if annotated is not None:
+            return annotated
+        return obj.published_count
+
+
+class CategorySummarySerializer(serializers.ModelSerializer):
+    """Category as nested in news list cards — no counts."""
+
+    class Meta:
+        model = Category
+        fields = [
+            "id",
+            "name",
+            "slug",
+            "description",
+        ]
@@ -0,0 +1,157 @@
+"""
+Gunicorn settings; gunicorn reads ./gunicorn.conf.py by default.
+
+    gunicorn                                    # sync workers, WSGI app
+    GUNICORN_WORKER_CLASS=gthread gunicorn
+    GUNICORN_WORKER_CLASS=uvicorn gunicorn      # ASGI app, async views
+
+Worker and thread counts follow the CPUs this process may run on; every
+value can be overridden with the GUNICORN_* variable next to it (or on
+the command line). The app is loaded once in the master (preload_app)
+and forked, so workers share its pages copy-on-write, and each worker is
+recycled after max_requests to cap slow memory growth.
+
+The hooks at the bottom log, per worker, how long it took from fork to
+ready and its memory: RSS, PSS (shared pages split across the processes
+using them) and private, i.e. what the worker really adds on top of the
+master.
+"""
+
+import os
+import time
+
+
+_started = time.monotonic()
+
+
+def _env(name, default):
+    return os.environ.get(name) or default
+
+
+def _cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not on Linux
+        return os.cpu_count() or 1
+
+
+# -----------------------------------
+# Workers
+# -----------------------------------
+WORKER_CLASSES = {
+    "sync": "sync",
+    "gthread": "gthread",
+    "uvicorn": "uvicorn.workers.UvicornWorker",
+}
+
+_kind = _env("GUNICORN_WORKER_CLASS", "sync")
+if _kind not in WORKER_CLASSES:
+    raise RuntimeError(
+        f"GUNICORN_WORKER_CLASS must be one of {', '.join(WORKER_CLASSES)}, not {_kind!r}"
+    )
+worker_class = WORKER_CLASSES[_kind]
+
+# The ASGI entry point turns on the async public views.
+wsgi_app = _env(
+    "GUNICORN_APP",
+    "news_backend.asgi:application" if _kind == "uvicorn" else "news_backend.wsgi:application",
+)
+
+# Sync workers block on I/O, so run more than there are CPUs; threaded
+# and event-loop workers overlap I/O themselves and need about one per CPU.
+_cpu_count = _cpus()
+workers = int(_env("GUNICORN_WORKERS", 2 * _cpu_count + 1 if _kind == "sync" else _cpu_count + 1))
+threads = int(_env("GUNICORN_THREADS", 4 if _kind == "gthread" else 1))
+
+# -----------------------------------
+# Lifecycle
+# -----------------------------------
+bind = _env("GUNICORN_BIND", "0.0.0.0:8000")
+preload_app = _env("GUNICORN_PRELOAD", "True") == "True"
+
+max_requests = int(_env("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(_env("GUNICORN_MAX_REQUESTS_JITTER", 200))  # don't recycle all at once
+
+# Public reads answer in milliseconds; 30 s only guards against a stuck
+# worker (imports and bulk endpoints included).
+timeout = int(_env("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(_env("GUNICORN_GRACEFUL_TIMEOUT", 30))
+# Behind a load balancer: keep idle connections a little longer than it
+# polls, so it never reuses one we are closing.
+keepalive = int(_env("GUNICORN_KEEPALIVE", 5))
+
+# Heartbeat files in RAM: a container's overlay filesystem can stall them.
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+accesslog = _env("GUNICORN_ACCESS_LOG", None)
+errorlog = "-"
+loglevel = _env("GUNICORN_LOG_LEVEL", "info")
+
+
+# -----------------------------------
+# Hooks: boot time and memory per worker
+# -----------------------------------
+def memory():
+    """RSS / PSS / private memory of this process in MiB (Linux)."""
+    fields = {}
+    try:
+        with open("/proc/self/smaps_rollup") as fh:
+            for line in fh:
+                name, _, value = line.partition(":")
+                if value.strip().endswith("kB"):
+                    fields[name] = int(value.split()[0])
+    except OSError:
+        return {}
+    private = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    return {
+        "rss": fields.get("Rss", 0) / 1024,
+        "pss": fields.get("Pss", 0) / 1024,
+        "private": private / 1024,
+    }
+
+
+def _describe(usage):
+    if not usage:
+        return "memory n/a"
+    return "rss {rss:.1f} MiB, pss {pss:.1f} MiB, private {private:.1f} MiB".format(**usage)
+
+
+def when_ready(server):
+    if server.cfg.preload_app:
+        # Import every view, serializer and URL pattern now rather than on
+        # each worker's first request, so those pages are shared too.
+        from django.urls import get_resolver
+
+        get_resolver().url_patterns
+
+    server.log.info(
+        "master ready in %.0f ms (preload_app=%s, %d x %s, %d threads); %s",
+        (time.monotonic() - _started) * 1000, server.cfg.preload_app,
+        server.cfg.workers, _kind, server.cfg.threads, _describe(memory()),
+    )
+
+
+def pre_fork(server, worker):
+    worker.forked_at = time.monotonic()
+
+
+def post_fork(server, worker):
+    if server.cfg.preload_app:
+        # Nothing the master opened may be shared with a worker.
+        from django.db import connections
+
+        connections.close_all()
+
+
+def post_worker_init(worker):
+    worker.log.info(
+        "worker %s booted in %.0f ms; %s",
+        worker.pid, (time.monotonic() - worker.forked_at) * 1000, _describe(memory()),
+    )
+
+
+def worker_exit(server, worker):
+    worker.log.info(
+        "worker %s exiting after %s requests; %s",
+        worker.pid, getattr(worker, "nr", "?"), _describe(memory()),
+    )
@@ -21,6 +21,7 @@ class NewsAdmin(admin.ModelAdmin):
         "author",
         "status_badge",
         "published_at",
+        "scheduled_at",
     )
     list_filter = ("status", "category")
     search_fields = ("title", "summary")
@@ -33,6 +34,7 @@ class NewsAdmin(admin.ModelAdmin):
         color_map = {
             "draft": "#6c757d",
             "review": "#0d6efd",
+            "scheduled": "#fd7e14",
             "published": "#198754",
         }
         color = color_map.get(obj.status, "#000")
@@ -2,8 +2,12 @@
 API URL routing for News module — stable & production-safe.
 """
 
+from django.conf import settings
 from django.urls import path
-from . import api_views
+from . import api_views, async_views
+
+# Hot public reads: async views on ASGI deployments (news/async_views.py)
+public = async_views if settings.ASYNC_PUBLIC_VIEWS else api_views
 
 urlpatterns = [
 
@@ -12,7 +16,7 @@ urlpatterns = [
     # -------------------------------------------------
     path(
         "",
-        api_views.NewsListAPI.as_view(),
+        public.NewsListAPI.as_view(),
         name="news-list"
     ),
 
@@ -21,7 +25,7 @@ urlpatterns = [
     # -------------------------------------------------
     path(
         "latest/",
-        api_views.LatestNewsAPI.as_view(),
+        public.LatestNewsAPI.as_view(),
         name="news-latest"
     ),
 
@@ -30,7 +34,7 @@ urlpatterns = [
     # -------------------------------------------------
     path(
         "featured/",
-        api_views.FeaturedNewsAPI.as_view(),
+        public.FeaturedNewsAPI.as_view(),
         name="news-featured"
     ),
 
@@ -39,7 +43,7 @@ urlpatterns = [
     # -------------------------------------------------
     path(
         "category/<slug:category_slug>/",
-        api_views.NewsByCategoryAPI.as_view(),
+        public.NewsByCategoryAPI.as_view(),
         name="news-by-category"
     ),
 
@@ -52,6 +56,16 @@ urlpatterns = [
         name="news-my-articles"
     ),
     path("manage/create/", api_views.NewsCreateAPI.as_view()),
+    path(
+        "manage/cache-stats/",
+        api_views.CacheStatsAPI.as_view(),
+        name="news-cache-stats"
+    ),
+    path(
+        "manage/bulk/",
+        api_views.BulkWorkflowAPI.as_view(),
+        name="news-bulk-workflow"
+    ),
     path("manage/<slug:slug>/", api_views.NewsUpdateDeleteAPI.as_view()),
 
 
@@ -73,12 +87,21 @@ urlpatterns = [
 
 
 
+    # -------------------------------------------------
+    # Related Stories
+    # -------------------------------------------------
+    path(
+        "<slug:slug>/related/",
+        api_views.NewsRelatedAPI.as_view(),
+        name="news-related"
+    ),
+
     # -------------------------------------------------
     # News Detail (GET / PUT / DELETE)
     # -------------------------------------------------
     path(
         "<slug:slug>/",
-        api_views.NewsDetailAPI.as_view(),
+        public.NewsDetailAPI.as_view(),
         name="news-detail"
     ),
 
@@ -2,26 +2,100 @@
 News API — Stable, JWT-secured, role-aware
 """
 
+from collections import Counter
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db.models import Max, Sum
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from authors.models import Author
+from categories.models import Category
+from news_backend.cache import cached_response, stats as cache_stats
+from news_backend.conditional import conditional_get
+from news_backend.middleware import timed
+from news_backend.serialization import compiled
 
 from .models import NewsArticle
-from .serializers import NewsListSerializer, NewsDetailSerializer
+from .serializers import NewsListSerializer, NewsDetailSerializer, list_queryset
 from .permissions import IsAdminEditorReporter
+from .search import search_articles, attach_snippets
+from .pagination import get_list_paginator
+from .cards import card_queryset, cards_for, with_snippet
+from . import workflow
+
+
+LIST_PARAMS = ("page", "page_size", "cursor")
+
+
+def article_dependencies(data):
+    """Namespaces embedded in a serialized article (see news_backend/cache.py)."""
+    deps = [f"category:{data['category']['id']}"]
+    if data.get("author"):
+        deps.append(f"author:{data['author']['id']}")
+    return deps
 
 
 # -------------------------------------------------
-# Pagination
+# Conditional GET validators (see news_backend/conditional.py)
 # -------------------------------------------------
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = "page_size"
-    max_page_size = 100
+def _newest(stamps):
+    return max((s for s in stamps if s), default=None)
+
+
+def list_state(queryset, categories=None):
+    """
+    Fingerprint of a list: newest change of its articles, plus the newest
+    change of the categories and authors embedded in its cards. The row
+    count, which catches deletions (they leave no updated_at behind), is
+    the categories' published counters: no COUNT over the list itself,
+    and every query here is one index lookup.
+    """
+    if categories is None:
+        categories = Category.objects.all()
+    modified = queryset.aggregate(modified=Max("updated_at"))["modified"]
+    counted = categories.aggregate(modified=Max("updated_at"), count=Sum("published_count"))
+    stamps = (
+        modified,
+        counted["modified"],
+        Author.objects.aggregate(modified=Max("updated_at"))["modified"],
+    )
+    return (counted["count"],) + stamps, _newest(stamps)
+
+
+def published_list_state(request):
+    return list_state(NewsArticle.objects.filter(status="published"))
+
+
+def featured_list_state(request):
+    # Not just the featured rows: unfeaturing an article takes it out of
+    # that set without moving the set's newest updated_at, so a client
+    # revalidating with If-Modified-Since would get a stale 304. Every
+    # feature change still touches a published row.
+    return published_list_state(request)
+
+
+def category_list_state(request, category_slug):
+    return list_state(
+        NewsArticle.objects.filter(status="published", category__slug=category_slug),
+        Category.objects.filter(slug=category_slug),
+    )
+
+
+def article_state(request, slug):
+    stamps = (
+        NewsArticle.objects
+        .filter(slug=slug, status="published")
+        .values_list("updated_at", "category__updated_at", "author__updated_at")
+        .first()
+    )
+    if stamps is None:
+        return None
+    return stamps, _newest(stamps)
 
 
 # =================================================
@@ -29,93 +103,142 @@ class StandardResultsSetPagination(PageNumberPagination):
 # =================================================
 
 class NewsListAPI(APIView):
-    """Public news list"""
+    """
+    Public news list.
+    ?q=      full-text search (relevance order, or newest first with ?cursor)
+    ?cursor= keyset pagination for infinite scroll (see news/pagination.py)
+    """
     permission_classes = []
+    query_budget = 7  # cold: +2 building cards for rows that have none
+    use_replica = True
 
+    @conditional_get(published_list_state)
+    @cached_response("news:list", params=LIST_PARAMS + ("q",))
     def get(self, request):
-        qs = (
+        qs = card_queryset(
             NewsArticle.objects
             .filter(status="published")
-            .select_related("category", "author")
-            .order_by("-published_at")
+            .order_by("-published_at", "-id")
         )
 
-        q = request.GET.get("q")
+        q = request.GET.get("q", "").strip()
         if q:
-            qs = qs.filter(
-                Q(title__icontains=q)
-                | Q(summary__icontains=q)
-                | Q(content__icontains=q)
-            )
+            # Full-text index, ranked by relevance (see news/search.py)
+            qs = search_articles(qs, q)
 
-        paginator = StandardResultsSetPagination()
+        paginator = get_list_paginator(request)
         page = paginator.paginate_queryset(qs, request)
-        serializer = NewsListSerializer(page, many=True, context={"request": request})
-        return paginator.get_paginated_response(serializer.data)
+        results = cards_for(page)
+
+        if q:
+            page = attach_snippets(page, q, using=qs.db)
+            results = [
+                with_snippet(card, article.search_snippet)
+                for card, article in zip(results, page)
+            ]
+        return paginator.get_paginated_response(results)
 
 
 class NewsDetailAPI(APIView):
     """Public news detail"""
     permission_classes = []
+    query_budget = 3
+    use_replica = True
 
+    @conditional_get(article_state)
+    @cached_response("news:article:{slug}", depends_on=article_dependencies)
     def get(self, request, slug):
+        # One query for the article and its joins, one for the gallery.
         article = get_object_or_404(
-            NewsArticle,
+            NewsArticle.objects
+            .select_related("category", "author")
+            .prefetch_related("gallery_images")
+            .defer("list_card"),
             slug=slug,
             status="published"
         )
-        serializer = NewsDetailSerializer(article, context={"request": request})
-        return Response(serializer.data)
+        return Response(compiled(NewsDetailSerializer)(article))
+
+
+class NewsRelatedAPI(APIView):
+    """
+    Related stories for an article, precomputed by news/related.py.
+    A lookup only: one query for the neighbours' cards.
+    """
+    permission_classes = []
+    query_budget = 2
+    use_replica = True
+
+    @cached_response("news:list")
+    def get(self, request, slug):
+        qs = card_queryset(
+            NewsArticle.objects
+            .filter(status="published", related_backlinks__article__slug=slug)
+            .order_by("-related_backlinks__score")
+        )
+        results = cards_for(list(qs))
+
+        if not results:
+            get_object_or_404(NewsArticle, slug=slug, status="published")
+        return Response(results)
 
 
 class NewsByCategoryAPI(APIView):
     permission_classes = []
+    query_budget = 7  # cold: +2 building cards for rows that have none
+    use_replica = True
 
+    @conditional_get(category_list_state)
+    @cached_response("news:category:{category_slug}", params=LIST_PARAMS)
     def get(self, request, category_slug):
-        qs = (
+        qs = card_queryset(
             NewsArticle.objects
             .filter(status="published", category__slug=category_slug)
-            .select_related("category", "author")
-            .order_by("-published_at")
+            .order_by("-published_at", "-id")
         )
 
-        paginator = StandardResultsSetPagination()
+        paginator = get_list_paginator(request)
         page = paginator.paginate_queryset(qs, request)
-        serializer = NewsListSerializer(page, many=True, context={"request": request})
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response(cards_for(page))
 
 
 class LatestNewsAPI(APIView):
     permission_classes = []
+    query_budget = 6  # cold: +2 building cards for rows that have none
+    use_replica = True
 
+    @conditional_get(published_list_state)
+    @cached_response("news:list", params=("limit",))
     def get(self, request):
         try:
             limit = min(int(request.GET.get("limit", 5)), 50)
         except ValueError:
             limit = 5
 
-        qs = (
+        qs = card_queryset(
             NewsArticle.objects
             .filter(status="published")
-            .order_by("-published_at")[:limit]
+            .order_by("-published_at")
         )
 
-        serializer = NewsListSerializer(qs, many=True, context={"request": request})
-        return Response(serializer.data)
+        return Response(cards_for(qs[:limit]))
 
 
 class FeaturedNewsAPI(APIView):
     permission_classes = []
+    query_budget = 6  # cold: +2 building cards for rows that have none
+    use_replica = True
 
+    @conditional_get(featured_list_state)
+    @cached_response("news:featured")
     def get(self, request):
-        qs = (
+        qs = card_queryset(
             NewsArticle.objects
             .filter(status="published", is_featured=True)
-            .order_by("-published_at")[:10]
+            .order_by("-published_at")
         )
 
-        serializer = NewsListSerializer(qs, many=True, context={"request": request})
-        return Response(serializer.data)
+        return Response(cards_for(qs[:10]))
 
 
 # =================================================
@@ -142,7 +265,9 @@ class NewsCreateAPI(APIView):
         serializer = NewsDetailSerializer(data=data, context={"request": request})
         if serializer.is_valid():
             serializer.save(author=author)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            with timed("serialize"):
+                data = serializer.data
+            return Response(data, status=status.HTTP_201_CREATED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -169,7 +294,9 @@ class NewsUpdateDeleteAPI(APIView):
 
         if serializer.is_valid():
             serializer.save()
-            return Response(serializer.data)
+            with timed("serialize"):
+                data = serializer.data
+            return Response(data)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -202,17 +329,18 @@ class MyArticlesAPI(APIView):
 
         author = request.user.author_profile
 
-        qs = (
+        qs = list_queryset(
             NewsArticle.objects
             .filter(author=author)
-            .select_related("category", "author")
             .order_by("-id")   # ✅ FIXED (was created_at)
         )
 
         serializer = NewsListSerializer(
             qs, many=True, context={"request": request}
         )
-        return Response(serializer.data)
+        with timed("serialize"):
+            data = serializer.data
+        return Response(data)
 
 # -------------------------------------------------
 # SUBMIT FOR REVIEW (REPORTER)
@@ -260,12 +388,40 @@ class PublishArticleAPI(APIView):
 
         article = get_object_or_404(NewsArticle, slug=slug)
 
-        if article.status != "review":
+        # The bulk endpoint's rule: scheduled articles can also be
+        # rescheduled or published right away.
+        rule = workflow.ACTIONS["publish"]
+        if article.status not in rule.from_statuses:
             return Response(
-                {"detail": "Only reviewed articles can be published"},
+                {"detail": rule.refusal},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Optional "publish_at": a future time schedules the article for
+        # manage.py publish_scheduled instead of publishing it now.
+        publish_at = request.data.get("publish_at")
+        if publish_at:
+            publish_at = parse_datetime(str(publish_at))
+            if publish_at is None:
+                return Response(
+                    {"detail": "publish_at must be an ISO 8601 datetime"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if timezone.is_naive(publish_at):
+                publish_at = timezone.make_aware(publish_at)
+
+        if publish_at and publish_at > timezone.now():
+            article.status = "scheduled"
+            article.scheduled_at = publish_at
+            article.save()
+            return Response(
+                {
+                    "detail": "Article scheduled",
+                    "scheduled_at": publish_at.isoformat(),
+                },
+                status=status.HTTP_200_OK
+            )
+
         article.status = "published"
         article.save()
 
@@ -273,3 +429,72 @@ class PublishArticleAPI(APIView):
             {"detail": "Article published successfully"},
             status=status.HTTP_200_OK
         )
+
+
+# -------------------------------------------------
+# BULK WORKFLOW (SUBMIT / PUBLISH / DELETE)
+# -------------------------------------------------
+class BulkWorkflowAPI(APIView):
+    """
+    POST {"action": "submit" | "publish" | "delete", "slugs": [...]}
+
+    Same rules as the single-article endpoints, one transaction and one
+    set-based write for the whole list (news/workflow.py). Returns a
+    result per slug.
+    """
+    permission_classes = [IsAuthenticated, IsAdminEditorReporter]
+    query_budget = 24  # includes one counter update per category touched
+
+    def post(self, request):
+        author = request.user.author_profile
+        action = request.data.get("action")
+        slugs = request.data.get("slugs")
+
+        if action not in workflow.ACTIONS:
+            return Response(
+                {"detail": f"action must be one of {', '.join(workflow.ACTIONS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if (
+            not isinstance(slugs, list) or not slugs
+            or not all(isinstance(slug, str) for slug in slugs)
+        ):
+            return Response(
+                {"detail": "slugs must be a non-empty list of strings"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(slugs) > workflow.MAX_SLUGS:
+            return Response(
+                {"detail": f"At most {workflow.MAX_SLUGS} slugs per request"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not workflow.allowed(action, author):
+            return Response(
+                {"detail": "Permission denied"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        results = workflow.apply(action, slugs, author)
+        return Response({
+            "action": action,
+            "results": results,
+            "counts": dict(Counter(result["result"] for result in results)),
+        })
+
+
+# -------------------------------------------------
+# RESPONSE CACHE STATS (ADMIN)
+# -------------------------------------------------
+class CacheStatsAPI(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        author = getattr(request.user, "author_profile", None)
+
+        if author is None or author.role != "admin":
+            return Response(
+                {"detail": "Permission denied"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        return Response(cache_stats())
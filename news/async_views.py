@@ -0,0 +1,202 @@
+"""
+Async versions of the hot public read views, for ASGI deployments.
+
+news/api_urls.py serves these instead of their api_views counterparts
+when ASYNC_PUBLIC_VIEWS is on (news_backend/asgi.py turns it on). They
+answer with the same JSON, validators and cache entries as the sync
+views, so either can serve a request; what changes is that a request
+waiting on the database or on a slow client holds a coroutine, not a
+worker.
+
+Single queries use the async ORM. DRF's paginators and the search
+helpers are synchronous, so a list page is built in one sync_to_async
+call; cards that are already built are decoded without leaving the
+event loop.
+"""
+
+from asgiref.sync import sync_to_async
+from django.db.models import Max, Sum
+from django.views import View
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+
+from authors.models import Author
+from categories.models import Category
+from news_backend.cache import acached_response
+from news_backend.conditional import aconditional_get
+from news_backend.responses import JSONResponse
+from news_backend.serialization import compiled
+
+from .api_views import LIST_PARAMS, _newest, article_dependencies
+from .cards import card_queryset, cards_for, with_snippet
+from .models import NewsArticle
+from .pagination import get_list_paginator
+from .search import attach_snippets, search_articles
+from .serializers import NewsDetailSerializer
+
+
+def not_found(model):
+    # get_object_or_404()'s message, as DRF passes it through.
+    detail = f"No {model._meta.object_name} matches the given query."
+    return JSONResponse({"detail": detail}, status=404)
+
+
+async def acards_for(articles):
+    """cards_for(), leaving the event loop only when a card must be built."""
+    if any(article.list_card is None for article in articles):
+        return await sync_to_async(cards_for)(articles)
+    return cards_for(articles)
+
+
+def _list_page(request, queryset, q=""):
+    # What NewsListAPI / NewsByCategoryAPI do after their decorators.
+    request = Request(request)
+    if q:
+        queryset = search_articles(queryset, q)
+    paginator = get_list_paginator(request)
+    try:
+        page = paginator.paginate_queryset(queryset, request)
+    except APIException as exc:
+        return JSONResponse({"detail": exc.detail}, status=exc.status_code)
+
+    results = cards_for(page)
+    if q:
+        page = attach_snippets(page, q, using=queryset.db)
+        results = [
+            with_snippet(card, article.search_snippet)
+            for card, article in zip(results, page)
+        ]
+    return JSONResponse(paginator.get_paginated_response(results).data)
+
+
+# -------------------------------------------------
+# Conditional GET validators (async twins of api_views')
+# -------------------------------------------------
+async def list_state(queryset, categories=None):
+    if categories is None:
+        categories = Category.objects.all()
+    modified = (await queryset.aaggregate(modified=Max("updated_at")))["modified"]
+    counted = await categories.aaggregate(modified=Max("updated_at"), count=Sum("published_count"))
+    stamps = (
+        modified,
+        counted["modified"],
+        (await Author.objects.aaggregate(modified=Max("updated_at")))["modified"],
+    )
+    return (counted["count"],) + stamps, _newest(stamps)
+
+
+async def published_list_state(request):
+    return await list_state(NewsArticle.objects.filter(status="published"))
+
+
+async def featured_list_state(request):
+    return await published_list_state(request)
+
+
+async def category_list_state(request, category_slug):
+    return await list_state(
+        NewsArticle.objects.filter(status="published", category__slug=category_slug),
+        Category.objects.filter(slug=category_slug),
+    )
+
+
+async def article_state(request, slug):
+    stamps = await (
+        NewsArticle.objects
+        .filter(slug=slug, status="published")
+        .values_list("updated_at", "category__updated_at", "author__updated_at")
+        .afirst()
+    )
+    if stamps is None:
+        return None
+    return stamps, _newest(stamps)
+
+
+# =================================================
+# PUBLIC APIs
+# =================================================
+
+class NewsListAPI(View):
+    query_budget = 7  # cold: +2 building cards for rows that have none
+    use_replica = True
+
+    @aconditional_get(published_list_state)
+    @acached_response("news:list", params=LIST_PARAMS + ("q",))
+    async def get(self, request):
+        qs = card_queryset(
+            NewsArticle.objects
+            .filter(status="published")
+            .order_by("-published_at", "-id")
+        )
+        q = request.GET.get("q", "").strip()
+        return await sync_to_async(_list_page)(request, qs, q)
+
+
+class NewsDetailAPI(View):
+    query_budget = 3
+    use_replica = True
+
+    @aconditional_get(article_state)
+    @acached_response("news:article:{slug}", depends_on=article_dependencies)
+    async def get(self, request, slug):
+        try:
+            article = await (
+                NewsArticle.objects
+                .select_related("category", "author")
+                .prefetch_related("gallery_images")
+                .defer("list_card")
+                .aget(slug=slug, status="published")
+            )
+        except NewsArticle.DoesNotExist:
+            return not_found(NewsArticle)
+        return JSONResponse(compiled(NewsDetailSerializer)(article))
+
+
+class NewsByCategoryAPI(View):
+    query_budget = 7  # cold: +2 building cards for rows that have none
+    use_replica = True
+
+    @aconditional_get(category_list_state)
+    @acached_response("news:category:{category_slug}", params=LIST_PARAMS)
+    async def get(self, request, category_slug):
+        qs = card_queryset(
+            NewsArticle.objects
+            .filter(status="published", category__slug=category_slug)
+            .order_by("-published_at", "-id")
+        )
+        return await sync_to_async(_list_page)(request, qs)
+
+
+class LatestNewsAPI(View):
+    query_budget = 6  # cold: +2 building cards for rows that have none
+    use_replica = True
+
+    @aconditional_get(published_list_state)
+    @acached_response("news:list", params=("limit",))
+    async def get(self, request):
+        try:
+            limit = min(int(request.GET.get("limit", 5)), 50)
+        except ValueError:
+            limit = 5
+
+        qs = card_queryset(
+            NewsArticle.objects
+            .filter(status="published")
+            .order_by("-published_at")
+        )
+        return JSONResponse(await acards_for([a async for a in qs[:limit]]))
+
+
+class FeaturedNewsAPI(View):
+    query_budget = 6  # cold: +2 building cards for rows that have none
+    use_replica = True
+
+    @aconditional_get(featured_list_state)
+    @acached_response("news:featured")
+    async def get(self, request):
+        qs = card_queryset(
+            NewsArticle.objects
+            .filter(status="published", is_featured=True)
+            .order_by("-published_at")
+        )
+        return JSONResponse(await acards_for([a async for a in qs[:10]]))
@@ -0,0 +1,117 @@
+"""
+Precomputed list cards.
+
+Every published article keeps its NewsListSerializer output as JSON text
+in ``NewsArticle.list_card``, rendered exactly as ORJSONRenderer renders
+it. List endpoints splice those fragments into the response as RawJSON
+(news_backend/renderers.py) instead of running the serializer per row,
+or even decoding the card; signals (news/signals.py) rebuild a card
+whenever the article, its author or its category changes.
+``manage.py rebuild_cards`` rebuilds them all.
+"""
+
+import itertools
+
+from django.db import connection
+
+from news_backend.middleware import timed
+from news_backend.renderers import ORJSONRenderer, RawJSON
+from news_backend.serialization import compiled
+
+from .models import NewsArticle
+from .serializers import NewsListSerializer, list_queryset
+
+
+CARD_FIELDS = ("id", "published_at", "list_card")
+
+_BATCH_SIZE = 500
+
+
+_renderer = ORJSONRenderer()
+
+
+def _dumps(data):
+    return _renderer.render(data).decode()
+
+
+def render_card(article):
+    """JSON text of the list card, or None for unpublished articles."""
+    if article.status != "published":
+        return None
+    return _dumps(compiled(NewsListSerializer)(article))
+
+
+def render_cards(articles):
+    """render_card() for many articles."""
+    published = [article for article in articles if article.status == "published"]
+    data = compiled(NewsListSerializer).many(published)
+    cards = {article.pk: _dumps(item) for article, item in zip(published, data)}
+    return [cards.get(article.pk) for article in articles]
+
+
+def _store_cards(articles):
+    # Plain executemany: bulk_update's CASE WHEN costs more to build
+    # than the write itself at this size.
+    quote = connection.ops.quote_name
+    sql = "UPDATE {} SET {} = %s WHERE {} = %s".format(
+        quote(NewsArticle._meta.db_table), quote("list_card"), quote("id"),
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, [(article.list_card, article.pk) for article in articles])
+
+
+def refresh_card(article):
+    """Rebuild one article's card; skips the write when nothing changed."""
+    card = render_card(article)
+    if card != article.list_card:
+        NewsArticle.objects.filter(pk=article.pk).update(list_card=card)
+        article.list_card = card
+    return card
+
+
+def refresh_cards(queryset):
+    """Rebuild the cards of every published article in ``queryset``."""
+    articles = list_queryset(
+        queryset.filter(status="published")
+    ).iterator(chunk_size=_BATCH_SIZE)
+
+    refreshed = 0
+    while batch := list(itertools.islice(articles, _BATCH_SIZE)):
+        for article, card in zip(batch, render_cards(batch)):
+            article.list_card = card
+        _store_cards(batch)
+        refreshed += len(batch)
+    return refreshed
+
+
+def card_queryset(queryset):
+    """Restrict a list queryset to the columns the card path reads."""
+    return queryset.select_related(None).only(*CARD_FIELDS)
+
+
+@timed("serialize")
+def cards_for(articles):
+    """
+    RawJSON cards for a page of articles loaded through card_queryset().
+
+    Rows without a card yet (created before cards existed) are built in
+    one extra query and stored, so each is only ever built once.
+    """
+    missing = [article.pk for article in articles if article.list_card is None]
+    if missing:
+        built = list(list_queryset(NewsArticle.objects.filter(pk__in=missing)))
+        for article, card in zip(built, render_cards(built)):
+            article.list_card = card
+        _store_cards(built)
+
+        cards = {article.pk: article.list_card for article in built}
+        for article in articles:
+            if article.list_card is None:
+                article.list_card = cards.get(article.pk)
+
+    return [RawJSON(article.list_card) for article in articles]
+
+
+def with_snippet(card, snippet):
+    """``card`` with a trailing "snippet" key, still without decoding it."""
+    return RawJSON(f"{card.json[:-1]},{_dumps({'snippet': snippet})[1:]}")
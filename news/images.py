@@ -0,0 +1,153 @@
+"""
+Responsive image variants for featured and gallery images.
+
+After an upload, a background task (news_backend/tasks.py) reads the
+original from storage, writes resized copies at IMAGE_VARIANT_WIDTHS in
+each of IMAGE_VARIANT_FORMATS next to it, and records them in the
+model's ``<field>_variants`` JSON:
+
+    {"source": "news/images/a.jpg",
+     "variants": [{"width": 320, "format": "webp",
+                   "name": "news/images/a-320w.webp"}, ...]}
+
+``source`` ties the variants to one upload: serializers ignore variants
+whose source is not the current file, so a replaced image never shows
+its predecessor's sizes while new ones are being made.
+"""
+
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from news_backend.media import media_url
+from news_backend.tasks import submit_on_commit
+
+# Pillow format name, file extension, save options.
+FORMATS = {
+    "webp": ("WEBP", "webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "jpg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+
+def variant_widths():
+    return sorted(getattr(settings, "IMAGE_VARIANT_WIDTHS", (320, 640, 1024, 1600)))
+
+
+def variant_formats():
+    return list(getattr(settings, "IMAGE_VARIANT_FORMATS", ("webp", "jpeg")))
+
+
+def needs_variants(field_file, variants):
+    return bool(field_file) and (variants or {}).get("source") != field_file.name
+
+
+def _flatten(image):
+    """JPEG has no alpha channel: composite transparent images on white."""
+    if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def render_variants(field_file):
+    """Write every variant of ``field_file``; returns the variants JSON."""
+    storage, name = field_file.storage, field_file.name
+    with storage.open(name, "rb") as fh:
+        original = Image.open(fh)
+        original.load()
+    original = ImageOps.exif_transpose(original)
+    if original.mode not in ("RGB", "RGBA"):
+        original = original.convert("RGBA" if "transparency" in original.info else "RGB")
+
+    # Never upscale; an image narrower than every width gets one variant
+    # at its own width, so clients can always rely on the modern format.
+    widths = [w for w in variant_widths() if w < original.width] or [original.width]
+    root = os.path.splitext(name)[0]
+    # Already off the request path: skip staging (news_backend/storage.py).
+    target_storage = getattr(storage, "remote", storage)
+
+    variants = []
+    # Largest first, each resized from the previous: much cheaper than
+    # resampling the full original every time, with no visible loss.
+    image = original
+    for width in sorted(widths, reverse=True):
+        height = max(1, round(original.height * width / original.width))
+        image = image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+        for fmt in variant_formats():
+            pil_format, extension, options = FORMATS[fmt]
+            out = image if fmt == "webp" else _flatten(image)
+            buffer = BytesIO()
+            out.save(buffer, pil_format, **options)
+
+            target = f"{root}-{width}w.{extension}"
+            if target_storage.exists(target):
+                target_storage.delete(target)
+            saved = target_storage.save(target, ContentFile(buffer.getvalue()))
+            variants.append({"width": width, "format": fmt, "name": saved})
+
+    variants.sort(key=lambda v: (v["width"], v["format"]))
+    return {"source": name, "variants": variants}
+
+
+def generate_variants(model, pk, field):
+    """
+    Background task: build variants for ``model.<field>`` of row ``pk``.
+
+    Saved with update_fields, so the regular post_save signals refresh
+    list cards and retire cached responses.
+    """
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return
+    field_file = getattr(instance, field)
+    variants_field = f"{field}_variants"
+    if not needs_variants(field_file, getattr(instance, variants_field)):
+        return
+
+    variants = render_variants(field_file)
+
+    # Replaced while we worked? The new upload has its own task.
+    current = model.objects.filter(pk=pk).values_list(field, flat=True).first()
+    if current != field_file.name:
+        return
+
+    setattr(instance, variants_field, variants)
+    update_fields = [variants_field]
+    if any(f.name == "updated_at" for f in model._meta.concrete_fields):
+        update_fields.append("updated_at")
+    instance.save(update_fields=update_fields)
+
+
+def schedule_variants(instance, field):
+    """Queue generate_variants() after commit if the image has none yet."""
+    if needs_variants(getattr(instance, field), getattr(instance, f"{field}_variants")):
+        submit_on_commit(generate_variants, type(instance), instance.pk, field)
+
+
+# -------------------------------------------------
+# Serializer helpers
+# -------------------------------------------------
+def variant_urls(field_file, variants):
+    """[{width, format, url}] for the current file's variants."""
+    if not field_file or not variants or variants.get("source") != field_file.name:
+        return []
+    storage = field_file.storage
+    return [
+        {"width": v["width"], "format": v["format"], "url": media_url(v["name"], storage)}
+        for v in variants["variants"]
+    ]
+
+
+def srcsets(urls):
+    """{format: "url 320w, url 640w"} for an <img>/<source> srcset."""
+    out = {}
+    for variant in urls:
+        entry = f"{variant['url']} {variant['width']}w"
+        out[variant["format"]] = f"{out[variant['format']]}, {entry}" if variant["format"] in out else entry
+    return out
@@ -0,0 +1,243 @@
+"""
+Bulk article import (management command ``import_articles``).
+
+Records stream from a JSONL or CSV file and are written with bulk_create
+in batches, one transaction per batch. Nothing goes through
+NewsArticle.save(): slugs come from SlugAllocator (one query per batch
+instead of one per article), reading time and SEO fallbacks are filled
+in here, and each batch redoes the signal work itself (category
+counters, list cards, response cache).
+
+Record fields (JSONL keys or CSV columns):
+
+    title, content                  required
+    category                        slug or name
+    author                          username or author name (unknown: none)
+    slug, summary, status, seo_title, seo_description,
+    is_featured, is_breaking, published_at (ISO 8601), featured_image
+    scheduled_at (ISO 8601)         required when status is "scheduled"
+"""
+
+import csv
+import datetime
+import json
+from collections import Counter
+
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.text import slugify
+
+from authors.models import Author
+from categories.models import Category
+
+from .models import NewsArticle
+
+
+class RecordError(ValueError):
+    pass
+
+
+# -------------------------------------------------
+# Reading
+# -------------------------------------------------
+def read_records(path, fmt=None):
+    """Yield one dict per record, streaming; ``fmt`` defaults to the extension."""
+    fmt = fmt or ("csv" if str(path).lower().endswith(".csv") else "jsonl")
+    with open(path, newline="", encoding="utf-8") as fh:
+        if fmt == "csv":
+            yield from csv.DictReader(fh)
+            return
+        for number, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield RecordError(f"line {number}: {exc}")
+
+
+def _flag(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y")
+    return bool(value)
+
+
+# -------------------------------------------------
+# Lookups
+# -------------------------------------------------
+class Lookups:
+    """Category and author ids by slug / name / username, loaded once."""
+
+    def __init__(self, create_categories=False):
+        self.create_categories = create_categories
+        self.categories = {}
+        for pk, slug, name in Category.objects.values_list("pk", "slug", "name"):
+            self.categories[slug] = pk
+            self.categories[name.lower()] = pk
+        self.category_slugs = dict(Category.objects.values_list("pk", "slug"))
+
+        self.authors = {}
+        for pk, name, username in Author.objects.values_list("pk", "name", "user__username"):
+            self.authors.setdefault(name.lower(), pk)
+            self.authors[username.lower()] = pk
+
+    def category(self, value):
+        key = (value or "").strip()
+        if not key:
+            raise RecordError("missing category")
+        pk = self.categories.get(key) or self.categories.get(key.lower())
+        if pk is None:
+            if not self.create_categories:
+                raise RecordError(f"unknown category {key!r}")
+            category = Category.objects.create(name=key)
+            pk = self.categories[key.lower()] = self.categories[category.slug] = category.pk
+            self.category_slugs[pk] = category.slug
+        return pk
+
+    def author(self, value):
+        key = (value or "").strip().lower()
+        return self.authors.get(key) if key else None
+
+
+# -------------------------------------------------
+# Slugs
+# -------------------------------------------------
+class SlugAllocator:
+    """
+    Unique slugs for a stream of articles, the way
+    NewsArticle.generate_unique_slug() picks them ("<base>" while it is
+    free, then "<base>-N" above the highest N taken), but with one query
+    per batch of bases and what is taken remembered in memory.
+
+    Only safe while nothing else creates articles with the same bases.
+    """
+
+    # SQLite caps expression depth at 1000; each base is two terms.
+    _QUERY_CHUNK = 200
+
+    def __init__(self):
+        self.highest = {}  # base -> highest suffix taken, 0 = none
+        self.bare = set()  # bases whose own slug is taken
+
+    def prime(self, bases):
+        unknown = sorted({b for b in bases if b not in self.highest})
+        for start in range(0, len(unknown), self._QUERY_CHUNK):
+            chunk = unknown[start:start + self._QUERY_CHUNK]
+            # As generate_unique_slug(): prefix matches, which use the slug
+            # index without depending on the collation's ordering of "-".
+            prefixes = Q()
+            for base in chunk:
+                prefixes |= Q(slug=base) | Q(slug__startswith=f"{base}-")
+            taken = NewsArticle.objects.filter(prefixes).values_list("slug", flat=True)
+            for base in chunk:
+                self.highest[base] = 0
+            for slug in taken:
+                self._mark(slug)
+
+    def _mark(self, slug):
+        # A slug is taken for its own base and, as "<base>-N", for the
+        # base it extends ("top-10" is suffix 10 of "top").
+        if slug in self.highest:
+            self.bare.add(slug)
+        base, _, suffix = slug.rpartition("-")
+        if suffix.isdigit() and base in self.highest:
+            self.highest[base] = max(self.highest[base], int(suffix))
+
+    def allocate(self, base):
+        self.highest.setdefault(base, 0)
+        slug = f"{base}-{self.highest[base] + 1}" if base in self.bare else base
+        self._mark(slug)
+        return slug
+
+
+_SLUG_MAX = NewsArticle._meta.get_field("slug").max_length - 8  # room for "-N"
+
+
+def base_slug(article):
+    """Slug to allocate from: the source slug if any, else the title."""
+    return slugify(article.slug or article.title)[:_SLUG_MAX] or "article"
+
+
+# -------------------------------------------------
+# Building rows
+# -------------------------------------------------
+def _datetime(record, key):
+    """Aware datetime from the ISO 8601 ``record[key]`` (UTC if naive); None if blank."""
+    if not record.get(key):
+        return None
+    value = parse_datetime(record[key])
+    if value is None:
+        raise RecordError(f"bad {key} {record[key]!r}")
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, datetime.timezone.utc)
+    return value
+
+
+def build_article(record, lookups, default_status="draft"):
+    """
+    ``(article, published_at)``: an unsaved NewsArticle for ``record`` (its
+    slug still to be allocated, see base_slug()) and the source publish time, if any. The time
+    is applied after insert, since auto_now_add overrides it on create.
+    """
+    if isinstance(record, RecordError):
+        raise record
+    if not isinstance(record, dict):
+        raise RecordError("record is not an object")
+    title = (record.get("title") or "").strip()
+    content = record.get("content") or ""
+    if not title or not content.strip():
+        raise RecordError("title and content are required")
+
+    status = (record.get("status") or default_status).strip().lower()
+    if status not in dict(NewsArticle.STATUS_CHOICES):
+        raise RecordError(f"unknown status {status!r}")
+
+    published_at = _datetime(record, "published_at")
+    scheduled_at = None
+    if status == "scheduled":
+        # news_scheduled_has_time: publish_scheduled needs the time.
+        scheduled_at = _datetime(record, "scheduled_at")
+        if scheduled_at is None:
+            raise RecordError("scheduled_at is required for scheduled articles")
+
+    summary = record.get("summary") or None
+    article = NewsArticle(
+        title=title[:300],
+        slug=record.get("slug") or "",
+        summary=summary,
+        content=content,
+        seo_title=(record.get("seo_title") or title)[:300],
+        seo_description=(record.get("seo_description") or (summary or "")[:160]) or None,
+        category_id=lookups.category(record.get("category")),
+        author_id=lookups.author(record.get("author")),
+        featured_image=record.get("featured_image") or None,
+        is_featured=_flag(record.get("is_featured")),
+        is_breaking=_flag(record.get("is_breaking")),
+        status=status,
+        scheduled_at=scheduled_at,
+    )
+    article.reading_time = article.calculate_reading_time()
+    return article, published_at
+
+
+def set_published_at(dated):
+    """
+    Write ``(article, published_at)`` pairs after insert. executemany,
+    because bulk_update's CASE WHEN is slower to build than to run.
+    """
+    quote = connection.ops.quote_name
+    sql = "UPDATE {} SET {} = %s WHERE {} = %s".format(
+        quote(NewsArticle._meta.db_table), quote("published_at"), quote("id"),
+    )
+    adapt = connection.ops.adapt_datetimefield_value
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, [(adapt(when), article.pk) for article, when in dated])
+    for article, when in dated:
+        article.published_at = when
+
+
+def published_deltas(articles):
+    """{category_id: +n} for the published articles in ``articles``."""
+    return Counter(a.category_id for a in articles if a.status == "published")
@@ -0,0 +1,60 @@
+"""
+Helpers shared by the bench_* management commands.
+"""
+
+import math
+import statistics
+import time
+from contextlib import contextmanager
+
+from django.db import transaction
+
+
+class _Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back(using=None):
+    """Run the block in a transaction that is always rolled back."""
+    try:
+        with transaction.atomic(using=using):
+            yield
+            raise _Rollback
+    except _Rollback:
+        pass
+
+
+class QueryCounter:
+    """
+    Count queries on a connection without DEBUG's 9000-query log cap.
+
+        with connection.execute_wrapper(counter := QueryCounter()):
+            ...
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def timed(fn, repeat=5):
+    """Median wall time of ``fn()`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def percentiles(samples, points=(50, 95, 99)):
+    """Nearest-rank percentiles of ``samples``, keyed by point."""
+    ordered = sorted(samples)
+    return {
+        point: ordered[max(0, math.ceil(point / 100 * len(ordered)) - 1)]
+        for point in points
+    }
@@ -0,0 +1,286 @@
+"""
+Benchmark every API route in-process.
+
+    python manage.py seed_news --articles 50000 --noinput
+    python manage.py bench_api --iterations 50
+    python manage.py bench_api --compare benchmarks/api-<commit>.json
+
+Walks news/api_urls.py, categories/api_urls.py and authors/api_urls.py
+and calls each route once per HTTP method its view implements, through
+the Django test client (full middleware and DRF stack, no network).
+Management routes are called as a throwaway admin author with a JWT;
+each write runs in a savepoint that is rolled back, so every iteration
+sees the same data.
+
+Reports p50/p95/p99 latency, queries and response bytes per endpoint
+and saves them as JSON, tagged with the git commit, for --compare.
+The response cache is cleared before every call unless --warm is set.
+"""
+
+import json
+import logging
+import os
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from importlib import import_module
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.utils.text import slugify
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from authors.models import Author
+from categories.models import Category
+from news.models import NewsArticle, GalleryImage
+from news_backend.cache import get_cache
+
+from ._bench import QueryCounter, percentiles, rolled_back
+
+
+URLCONFS = (
+    ("/api/news/", "news.api_urls"),
+    ("/api/categories/", "categories.api_urls"),
+    ("/api/authors/", "authors.api_urls"),
+)
+
+METHODS = ("get", "post", "put", "patch", "delete")
+
+# Extra query strings benchmarked for a route, besides the bare URL.
+VARIANTS = {
+    "/api/news/": ("?page=50", "?cursor=", "?q=election", "?q=cricket captain"),
+    "/api/news/latest/": ("?limit=50",),
+}
+
+
+def git_revision():
+    def git(*args):
+        try:
+            result = subprocess.run(
+                ("git",) + args, cwd=settings.BASE_DIR,
+                capture_output=True, text=True, timeout=30,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+    }
+
+
+class Command(BaseCommand):
+    help = "Benchmark every news, category and author API route."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument("--warm", action="store_true",
+                            help="Keep the response cache between calls.")
+        parser.add_argument("--filter", default="",
+                            help="Only endpoints whose name contains this.")
+        parser.add_argument("--output",
+                            help="Result file (default benchmarks/api-<commit>.json).")
+        parser.add_argument("--compare", metavar="FILE",
+                            help="Earlier result file to compare against.")
+
+    def handle(self, *args, **opts):
+        if opts["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1.")
+        if not NewsArticle.objects.filter(status="published").exists():
+            raise CommandError("No published articles; run seed_news first.")
+
+        # Broken routes are reported by status; keep their tracebacks and
+        # the per-request metric lines out (budget warnings stay).
+        logging.getLogger("django.request").setLevel(logging.CRITICAL)
+        logging.getLogger("news_backend.requests").setLevel(logging.WARNING)
+
+        with override_settings(ALLOWED_HOSTS=["testserver"], API_CACHE_ENABLED=True), rolled_back():
+            self.fixtures()
+            results = {}
+            for name, method, url, body in self.endpoints():
+                if opts["filter"] in name:
+                    results[name] = self.measure(method, url, body, opts)
+                    self.report(name, results[name])
+            dataset = self.dataset()
+
+        run = {
+            "git": git_revision(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "database": connection.vendor,
+            "dataset": dataset,
+            "iterations": opts["iterations"],
+            "cache": "warm" if opts["warm"] else "cold",
+            "endpoints": results,
+        }
+
+        output = opts["output"] or os.path.join(
+            "benchmarks", f"api-{(run['git']['commit'] or 'unknown')[:10]}.json"
+        )
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        with open(output, "w") as fh:
+            json.dump(run, fh, indent=2, sort_keys=True)
+        self.stderr.write(f"results written to {output}")
+
+        if opts["compare"]:
+            with open(opts["compare"]) as fh:
+                self.compare(json.load(fh), run)
+
+    # -------------------------------------------------
+    # Setup
+    # -------------------------------------------------
+    def fixtures(self):
+        """A throwaway admin author and the articles the write routes act on."""
+        user = User.objects.create(username="bench-api-admin", password="!")
+        self.author = Author.objects.create(user=user, name="Bench Admin", role="admin")
+        self.token = str(RefreshToken.for_user(user).access_token)
+
+        published = NewsArticle.objects.filter(status="published")
+        # Prefer an article with a gallery, like most real detail pages.
+        gallery = GalleryImage.objects.values("article")
+        self.article = published.filter(pk__in=gallery).first() or published.first()
+        self.category = Category.objects.order_by("-published_count").first()
+        self.byline = Author.objects.exclude(pk=self.author.pk).first() or self.author
+
+        def own(status):
+            return NewsArticle.objects.create(
+                title=f"Bench {status}", content=self.article.content,
+                category=self.category, author=self.author, status=status,
+            )
+        self.draft, self.review = own("draft"), own("review")
+
+    def dataset(self):
+        return {
+            "articles": NewsArticle.objects.count(),
+            "published": NewsArticle.objects.filter(status="published").count(),
+            "categories": Category.objects.count(),
+            "authors": Author.objects.count(),
+            "gallery_images": GalleryImage.objects.count(),
+        }
+
+    def params(self, route, prefix):
+        """URL kwargs for ``route``, keyed by the route's parameter names."""
+        if route.startswith("manage/submit/"):
+            slug = self.draft.slug
+        elif route.startswith("manage/publish/"):
+            slug = self.review.slug
+        elif prefix == "/api/authors/":
+            slug = slugify(self.byline.name)
+        elif prefix == "/api/categories/":
+            slug = self.category.slug
+        else:
+            slug = self.article.slug
+        return {"slug": slug, "category_slug": self.category.slug, "pk": self.byline.pk}
+
+    def body(self, method, route):
+        if method == "post" and route == "manage/create/":
+            return {
+                "title": "Bench created article",
+                "summary": "Created by bench_api.",
+                "content": self.article.content,
+                "category": self.category.pk,
+            }
+        if method in ("put", "patch"):
+            return {"summary": "Edited by bench_api."}
+        return None
+
+    def endpoints(self):
+        for prefix, module in URLCONFS:
+            for pattern in import_module(module).urlpatterns:
+                route = str(pattern.pattern)
+                view = pattern.callback.view_class
+                url = prefix + route
+                for name, value in self.params(route, prefix).items():
+                    url = url.replace(f"<slug:{name}>", str(value))
+                    url = url.replace(f"<int:{name}>", str(value))
+
+                for method in METHODS:
+                    if not hasattr(view, method):
+                        continue
+                    body = self.body(method, route)
+                    name = f"{method.upper()} {prefix}{route}"
+                    yield name, method, url, body
+                    if method == "get":
+                        for query in VARIANTS.get(prefix + route, ()):
+                            yield name + query, method, url + query, None
+
+    # -------------------------------------------------
+    # Measurement
+    # -------------------------------------------------
+    def measure(self, method, url, body, opts):
+        client = Client(raise_request_exception=False)
+        headers = {}
+        if "/manage/" in url:
+            headers["HTTP_AUTHORIZATION"] = f"Bearer {self.token}"
+        data = json.dumps(body) if body is not None else ""
+
+        samples, queries = [], []
+        for i in range(opts["warmup"] + opts["iterations"]):
+            if not opts["warm"]:
+                get_cache().clear()
+
+            counter = QueryCounter()
+            with rolled_back(), connection.execute_wrapper(counter):
+                start = time.perf_counter()
+                response = client.generic(
+                    method.upper(), url, data,
+                    content_type="application/json", **headers,
+                )
+                elapsed = (time.perf_counter() - start) * 1000
+
+            if i >= opts["warmup"]:
+                samples.append(elapsed)
+                queries.append(counter.count)
+
+        points = percentiles(samples)
+        return {
+            "method": method.upper(),
+            "url": url,
+            "status": response.status_code,
+            "p50_ms": round(points[50], 3),
+            "p95_ms": round(points[95], 3),
+            "p99_ms": round(points[99], 3),
+            "mean_ms": round(statistics.fmean(samples), 3),
+            "queries": int(statistics.median(queries)),
+            "bytes": len(response.content),
+        }
+
+    # -------------------------------------------------
+    # Output
+    # -------------------------------------------------
+    def report(self, name, result):
+        if not getattr(self, "_header", False):
+            self._header = True
+            self.stdout.write(
+                f"{'endpoint':<48} {'status':>6} {'p50 ms':>8} {'p95 ms':>8} "
+                f"{'p99 ms':>8} {'queries':>8} {'bytes':>9}"
+            )
+        self.stdout.write(
+            f"{name:<48} {result['status']:>6} {result['p50_ms']:>8.2f} "
+            f"{result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+            f"{result['queries']:>8} {result['bytes']:>9}"
+        )
+
+    def compare(self, before, after):
+        commit = (before.get("git") or {}).get("commit") or "?"
+        self.stdout.write(f"\ncompared with {commit[:10]} ({before.get('created')})")
+        self.stdout.write(
+            f"{'endpoint':<48} {'p50 ms':>17} {'change':>8} "
+            f"{'queries':>9} {'bytes':>17}"
+        )
+        for name, new in after["endpoints"].items():
+            old = before["endpoints"].get(name)
+            if old is None:
+                self.stdout.write(f"{name:<48} {'(new)':>17}")
+                continue
+            change = (new["p50_ms"] - old["p50_ms"]) / old["p50_ms"] * 100 if old["p50_ms"] else 0
+            self.stdout.write(
+                f"{name:<48} {old['p50_ms']:>8.2f}>{new['p50_ms']:<8.2f} {change:>+7.1f}% "
+                f"{old['queries']:>4}>{new['queries']:<4} {old['bytes']:>8}>{new['bytes']:<8}"
+            )
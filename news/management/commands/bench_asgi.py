@@ -0,0 +1,221 @@
+"""
+Benchmark the public reads under many concurrent slow clients: sync
+workers (WSGI) against one ASGI event loop.
+
+    python manage.py seed_news --articles 5000 --noinput
+    python manage.py bench_asgi --clients 500 --client-delay 0.2
+
+Every client arrives at once and is slow on both ends: its request takes
+half of --client-delay to arrive and its response half to be read. A
+sync worker is busy for all of that; under ASGI the wait is an await.
+Each mode runs in a fresh process, as it would be deployed:
+
+    wsgi         --workers sync workers (threads here), DRF views
+    asgi         one event loop, the same sync views (ASYNC_PUBLIC_VIEWS off)
+    asgi-async   one event loop, news/async_views.py
+
+No server or sockets are involved: the WSGI and ASGI handlers are
+called directly and the delays are sleeps, so the numbers isolate how
+many slow clients each model keeps in flight, not network overhead.
+The response cache is warmed first, as in production.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+from news.models import NewsArticle
+
+from ._bench import percentiles
+
+
+MODES = {
+    # mode: DJANGO_ASYNC_VIEWS
+    "wsgi": "False",
+    "asgi": "False",
+    "asgi-async": "True",
+}
+
+HOST = "bench.local"
+
+
+class Command(BaseCommand):
+    help = "Throughput of WSGI vs ASGI (sync and async views) under slow clients."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", type=int, default=500)
+        parser.add_argument("--client-delay", type=float, default=0.2,
+                            help="Seconds each client spends sending and reading.")
+        parser.add_argument("--workers", type=int, default=(os.cpu_count() or 1) * 2 + 1,
+                            help="Sync workers in wsgi mode (default 2 x CPUs + 1).")
+        parser.add_argument("--path", default="/api/news/latest/")
+        parser.add_argument("--mode", choices=MODES, help=(
+            "Run one mode in this process and print its result as JSON."
+        ))
+
+    def handle(self, *args, **opts):
+        if opts["mode"]:
+            self.stdout.write(json.dumps(self.run_mode(opts)))
+            return
+
+        if not NewsArticle.objects.filter(status="published").exists():
+            raise CommandError("No published articles; run seed_news first.")
+
+        self.stdout.write(
+            f"{opts['clients']} clients, {opts['client_delay'] * 1000:.0f} ms each, "
+            f"GET {opts['path']}"
+        )
+        self.stdout.write(
+            f"{'mode':<12}{'workers':>8}{'wall s':>9}{'req/s':>9}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}"
+        )
+        for mode, async_views in MODES.items():
+            result = self.spawn(mode, async_views, opts)
+            self.stdout.write(
+                f"{mode:<12}{result['workers']:>8}{result['wall']:>9.2f}{result['rps']:>9.0f}"
+                f"{result['p50']:>9.0f}{result['p95']:>9.0f}{result['p99']:>9.0f}"
+                f"{result['errors']:>8}"
+            )
+
+    def spawn(self, mode, async_views, opts):
+        env = dict(
+            os.environ,
+            DJANGO_ASYNC_VIEWS=async_views,
+            # One connection per request thread under ASGI; see settings.
+            DJANGO_CONN_MAX_AGE="0" if mode.startswith("asgi") else "60",
+        )
+        command = [
+            sys.executable, os.path.join(settings.BASE_DIR, "manage.py"), "bench_asgi",
+            "--mode", mode, "--clients", str(opts["clients"]),
+            "--client-delay", str(opts["client_delay"]),
+            "--workers", str(opts["workers"]), "--path", opts["path"],
+        ]
+        result = subprocess.run(command, env=env, capture_output=True, text=True)
+        if result.returncode:
+            raise CommandError(f"{mode} run failed:\n{result.stderr}")
+        return json.loads(result.stdout)
+
+    # -------------------------------------------------
+    # One mode, in this process
+    # -------------------------------------------------
+    def run_mode(self, opts):
+        logging.getLogger("news_backend.requests").setLevel(logging.ERROR)
+        logging.getLogger("django.request").setLevel(logging.CRITICAL)
+
+        with override_settings(ALLOWED_HOSTS=[HOST], API_CACHE_ENABLED=True):
+            if opts["mode"] == "wsgi":
+                from django.core.wsgi import get_wsgi_application
+                run, workers = self.run_wsgi, opts["workers"]
+                app = get_wsgi_application()
+            else:
+                from django.core.asgi import get_asgi_application
+                run, workers = self.run_asgi, 1
+                app = get_asgi_application()
+
+            half = opts["client_delay"] / 2
+            run(app, opts["path"], 1, 0.0, workers)  # warm the response cache
+            start = time.perf_counter()
+            latencies, errors = run(app, opts["path"], opts["clients"], half, workers)
+            wall = time.perf_counter() - start
+
+        points = percentiles(latencies)
+        return {
+            "workers": workers,
+            "wall": wall,
+            "rps": len(latencies) / wall,
+            "p50": points[50] * 1000,
+            "p95": points[95] * 1000,
+            "p99": points[99] * 1000,
+            "errors": errors,
+        }
+
+    def run_wsgi(self, app, url, clients, half, workers):
+        path, _, query = url.partition("?")
+
+        def client(arrived):
+            status = []
+            environ = {
+                "REQUEST_METHOD": "GET",
+                "PATH_INFO": path,
+                "QUERY_STRING": query,
+                "SCRIPT_NAME": "",
+                "SERVER_NAME": HOST,
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": HOST,
+                "wsgi.input": BytesIO(),
+                "wsgi.errors": sys.stderr,
+                "wsgi.url_scheme": "http",
+                "wsgi.version": (1, 0),
+                "wsgi.multithread": True,
+                "wsgi.multiprocess": True,
+                "wsgi.run_once": False,
+            }
+            time.sleep(half)  # the worker reads a trickling request
+            body = app(environ, lambda s, headers, exc_info=None: status.append(s))
+            try:
+                b"".join(body)
+            finally:
+                body.close()
+            time.sleep(half)  # ... and writes to a slow reader
+            return time.perf_counter() - arrived, not status[0].startswith("200")
+
+        arrived = time.perf_counter()
+        with ThreadPoolExecutor(workers) as pool:
+            results = list(pool.map(client, [arrived] * clients))
+        return [r[0] for r in results], sum(r[1] for r in results)
+
+    def run_asgi(self, app, url, clients, half, workers):
+        parts = urlsplit(url)
+
+        async def client(number, arrived):
+            received, status = False, []
+
+            async def receive():
+                nonlocal received
+                if received:
+                    await asyncio.Event().wait()  # never disconnects
+                await asyncio.sleep(half)  # the request trickles in
+                received = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    status.append(message["status"])
+                elif not message.get("more_body"):
+                    await asyncio.sleep(half)  # a slow reader
+
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": parts.path,
+                "raw_path": parts.path.encode(),
+                "query_string": parts.query.encode(),
+                "root_path": "",
+                "headers": [(b"host", HOST.encode())],
+                "client": ("127.0.0.1", 10000 + number),
+                "server": (HOST, 80),
+            }
+            await app(scope, receive, send)
+            return time.perf_counter() - arrived, status[0] != 200
+
+        async def main():
+            arrived = time.perf_counter()
+            return await asyncio.gather(*(client(n, arrived) for n in range(clients)))
+
+        results = asyncio.run(main())
+        return [r[0] for r in results], sum(r[1] for r in results)
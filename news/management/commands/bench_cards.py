@@ -0,0 +1,67 @@
+"""
+List page assembly: per-row serialization vs. precomputed cards.
+
+    python manage.py bench_cards --articles 2000
+
+Seeds ``--articles`` published articles, builds their cards, then times
+turning one page of rows into the rendered response body both ways, for
+10- and 100-row pages: the serializer plus ORJSONRenderer, against the
+stored cards spliced in verbatim. Each timing includes the page query.
+Both must produce the same bytes. Everything is rolled back.
+"""
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from authors.models import Author
+from news import synthetic
+from news.cards import card_queryset, cards_for, refresh_cards
+from news.models import NewsArticle
+from news.serializers import NewsListSerializer, list_queryset
+from news_backend.renderers import ORJSONRenderer
+
+from ._bench import rolled_back, timed
+
+
+class Command(BaseCommand):
+    help = "Benchmark list serialization against precomputed list cards."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--articles", type=int, default=2000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **opts):
+        with rolled_back():
+            self.seed(opts["articles"])
+            self.stdout.write(f"{'page':>5} {'serializer ms':>14} {'cards ms':>9} {'speedup':>8}")
+            for size in (10, 100):
+                self.run(size, opts["repeat"])
+
+    def seed(self, count):
+        categories = synthetic.ensure_categories(5, prefix="Bench Cards")
+        authors = [
+            Author.objects.create(
+                user=User.objects.create(username=f"bench-cards-{i}"),
+                name=f"Bench Author {i}",
+            )
+            for i in range(10)
+        ]
+        synthetic.bulk_articles(count, categories, authors, words=40, start=10_000_000)
+        refresh_cards(NewsArticle.objects.all())
+
+    def run(self, size, repeat):
+        published = NewsArticle.objects.filter(status="published").order_by("-published_at", "-id")
+        render = ORJSONRenderer().render
+
+        def serializer():
+            page = list(list_queryset(published)[:size])
+            return render(NewsListSerializer(page, many=True).data)
+
+        def cards():
+            return render(cards_for(list(card_queryset(published)[:size])))
+
+        assert serializer() == cards()
+
+        slow = timed(serializer, repeat)
+        fast = timed(cards, repeat)
+        self.stdout.write(f"{size:>5} {slow:>14.2f} {fast:>9.2f} {slow / fast:>7.1f}x")
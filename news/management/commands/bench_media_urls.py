@@ -0,0 +1,69 @@
+"""
+Media URL cost per list page: storage.url() vs news_backend/media.py.
+
+    python manage.py bench_media_urls
+
+Serializes a 100-row NewsListSerializer page (featured image plus author
+photo per row, no variants) with S3Boto3Storage as the remote storage,
+once with MEDIA_URLS_FROM_STORAGE on (botocore builds each URL) and once
+with the string builder. Rows are unsaved instances: no database time.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from authors.models import Author
+from categories.models import Category
+from news.models import NewsArticle
+from news.serializers import NewsListSerializer
+
+from ._bench import timed
+
+
+class Command(BaseCommand):
+    help = "Benchmark media URL building on a 100-row list page."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, **opts):
+        category = Category(id=1, name="Bench", slug="bench")
+        page = []
+        for i in range(opts["rows"]):
+            author = Author(id=i, name=f"Author {i}", photo=f"authors/photo-{i}.jpg")
+            page.append(NewsArticle(
+                id=i, title=f"Article {i}", slug=f"article-{i}", summary="Summary",
+                category=category, author=author, status="published",
+                featured_image=f"news/images/photo {i}.jpg",
+            ))
+
+        s3 = override_settings(
+            STORAGES={
+                **settings.STORAGES,
+                "remote": {
+                    "BACKEND": "storages.backends.s3boto3.S3Boto3Storage",
+                    "OPTIONS": {
+                        "bucket_name": "bench-bucket",
+                        "access_key": "bench", "secret_key": "bench",
+                        "region_name": "ap-south-1",
+                    },
+                },
+            },
+        )
+        with s3:
+            results = {}
+            for label, from_storage in (("storage.url()", True), ("media_url()", False)):
+                with override_settings(MEDIA_URLS_FROM_STORAGE=from_storage):
+                    def serialize():
+                        return NewsListSerializer(page, many=True).data
+                    sample = serialize()[0]  # warm the boto3 client
+                    results[label] = timed(serialize, repeat=opts["repeat"])
+                    self.stdout.write(
+                        f"{label:<14} {results[label]:7.2f} ms/page  "
+                        f"e.g. {sample['featured_image_url']}"
+                    )
+            self.stdout.write(
+                f"speedup {results['storage.url()'] / results['media_url()']:.1f}x"
+            )
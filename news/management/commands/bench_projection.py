@@ -0,0 +1,99 @@
+"""
+Bytes read from the database and peak memory per list page.
+
+    python manage.py bench_projection --articles 500 --words 3000
+
+Compares loading and serializing one list page from full rows
+(select_related, every column) with list_queryset() (list columns only)
+and with the precomputed cards. "DB bytes" is the size of the values
+the query returns; peak memory is tracemalloc's high-water mark while
+the page is fetched and serialized. Everything is rolled back.
+"""
+
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from news import synthetic
+from news.cards import card_queryset, cards_for, refresh_cards
+from news.models import NewsArticle
+from news.serializers import NewsListSerializer, list_queryset
+
+from ._bench import rolled_back
+
+
+def result_bytes(queryset):
+    """Size of every value ``queryset`` returns, as the driver hands it over."""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    total = 0
+    for row in rows:
+        for value in row:
+            if isinstance(value, str):
+                total += len(value.encode("utf-8"))
+            elif isinstance(value, (bytes, memoryview)):
+                total += len(value)
+            elif value is not None:
+                total += 8
+    return total
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class Command(BaseCommand):
+    help = "Measure DB bytes and peak memory per list page, full rows vs projection."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--articles", type=int, default=500)
+        parser.add_argument("--words", type=int, default=3000,
+                            help="Average article length in words.")
+
+    def handle(self, *args, **opts):
+        with rolled_back():
+            categories = synthetic.ensure_categories(4, prefix="Bench Projection")
+            synthetic.bulk_articles(
+                opts["articles"], categories, words=opts["words"], start=20_000_000
+            )
+            refresh_cards(NewsArticle.objects.all())
+
+            self.stdout.write(
+                f"{'page':>5} {'loader':<12} {'DB bytes':>11} {'peak KiB':>9}"
+            )
+            for size in (10, 100):
+                self.run(size)
+
+    def run(self, size):
+        published = NewsArticle.objects.filter(status="published").order_by("-published_at", "-id")
+        loaders = {
+            "full rows": published.select_related("category", "author"),
+            "projection": list_queryset(published),
+            "cards": card_queryset(published),
+        }
+
+        for label, queryset in loaders.items():
+            page = queryset[:size]
+
+            # .all() clones, so every call fetches the rows again.
+            if label == "cards":
+                def serialize():
+                    cards_for(list(page.all()))
+            else:
+                def serialize():
+                    NewsListSerializer(list(page.all()), many=True).data
+
+            serialize()  # warm imports and caches before measuring
+            self.stdout.write(
+                f"{size:>5} {label:<12} {result_bytes(page):>11,} "
+                f"{peak_memory(serialize) / 1024:>9,.0f}"
+            )
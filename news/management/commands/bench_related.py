@@ -0,0 +1,94 @@
+"""
+Related-articles index build time and endpoint latency.
+
+    python manage.py bench_related --articles 100000
+
+Generates ``--articles`` published articles, runs a full build of the
+related index (news/related.py) into a temporary file, then times
+``/api/news/<slug>/related/`` with a cold response cache and one
+incremental publish. Everything is rolled back.
+"""
+
+import logging
+import os
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+
+from news import related, synthetic
+from news.cards import refresh_cards
+from news.models import NewsArticle, RelatedArticle
+from news_backend.cache import get_cache
+
+from ._bench import percentiles, rolled_back
+
+
+class Command(BaseCommand):
+    help = "Benchmark the related-articles build and lookup."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--articles", type=int, default=100000)
+        parser.add_argument("--words", type=int, default=250,
+                            help="Average article length in words.")
+        parser.add_argument("--requests", type=int, default=200)
+
+    def handle(self, *args, **opts):
+        logging.getLogger("news_backend.requests").setLevel(logging.WARNING)
+        with tempfile.TemporaryDirectory() as tmp, rolled_back():
+            path = os.path.join(tmp, "related.npz")
+            self.run(path, opts)
+
+    def run(self, path, opts):
+        categories = synthetic.ensure_categories(10, prefix="Bench Related")
+        start = time.perf_counter()
+        synthetic.bulk_articles(opts["articles"], categories, words=opts["words"],
+                                start=30_000_000)
+        refresh_cards(NewsArticle.objects.all())
+        self.stderr.write(
+            f"generated {opts['articles']} articles in {time.perf_counter() - start:.1f}s"
+        )
+
+        start = time.perf_counter()
+        count = related.build_index(path=path)
+        build = time.perf_counter() - start
+        self.stdout.write(
+            f"build: {count} articles, {RelatedArticle.objects.count()} links, "
+            f"{build:.1f}s, index {os.path.getsize(path) / 2**20:.1f} MiB"
+        )
+
+        slugs = list(
+            NewsArticle.objects.filter(status="published")
+            .order_by("?").values_list("slug", flat=True)[:opts["requests"]]
+        )
+        client = Client()
+        samples = []
+        with override_settings(ALLOWED_HOSTS=["testserver"]):
+            for slug in slugs:
+                get_cache().clear()
+                start = time.perf_counter()
+                response = client.get(f"/api/news/{slug}/related/")
+                samples.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200
+        points = percentiles(samples)
+        self.stdout.write(
+            f"lookup: p50 {points[50]:.2f} ms, p95 {points[95]:.2f} ms, "
+            f"p99 {points[99]:.2f} ms over {len(samples)} requests"
+        )
+
+        source = NewsArticle.objects.filter(status="published").first()
+        article = NewsArticle.objects.create(
+            title=source.title, summary=source.summary, content=source.content,
+            category=source.category, status="draft",
+        )
+        article.status = "published"
+        start = time.perf_counter()
+        related.Index.load(path)
+        load = time.perf_counter() - start
+        start = time.perf_counter()
+        related.add_article(article, path=path)
+        self.stdout.write(
+            f"incremental publish: {(time.perf_counter() - start) * 1000:.0f} ms "
+            f"(of which ~{load * 1000:.0f} ms index load, read afresh under the writers' lock)"
+        )
@@ -0,0 +1,67 @@
+"""
+Render and parse cost of one list page: DRF's JSONRenderer / JSONParser
+against the orjson pair in news_backend/renderers.py and parsers.py.
+
+    python manage.py bench_renderers --articles 100 --repeat 50
+
+The page is NewsListSerializer over list_queryset(), serialized once;
+only rendering the resulting data (and parsing the bytes back) is timed.
+Both renderers must produce the same bytes. Everything is rolled back.
+"""
+
+from io import BytesIO
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from news import synthetic
+from news.models import NewsArticle
+from news.serializers import NewsListSerializer, list_queryset
+from news_backend.parsers import ORJSONParser
+from news_backend.renderers import ORJSONRenderer
+
+from ._bench import rolled_back, timed
+
+
+class Command(BaseCommand):
+    help = "Time JSONRenderer/JSONParser vs the orjson pair on a list page."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--articles", type=int, default=100,
+                            help="Items on the page.")
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, **opts):
+        with rolled_back():
+            categories = synthetic.ensure_categories(4, prefix="Bench Renderers")
+            synthetic.bulk_articles(opts["articles"], categories, start=21_000_000)
+
+            page = list_queryset(
+                NewsArticle.objects.filter(status="published").order_by("-published_at", "-id")
+            )[:opts["articles"]]
+            data = NewsListSerializer(list(page), many=True).data
+            self.run(data, opts["repeat"])
+
+    def run(self, data, repeat):
+        stock, fast = JSONRenderer(), ORJSONRenderer()
+        body = stock.render(data)
+        if fast.render(data) != body:
+            raise CommandError("ORJSONRenderer output differs from JSONRenderer's")
+
+        def parse(parser):
+            return lambda: parser.parse(BytesIO(body), parser_context={})
+
+        rows = [
+            ("render", timed(lambda: stock.render(data), repeat),
+             timed(lambda: fast.render(data), repeat)),
+            ("parse", timed(parse(JSONParser()), repeat),
+             timed(parse(ORJSONParser()), repeat)),
+        ]
+
+        self.stdout.write(f"{len(data)} items, {len(body):,} bytes")
+        self.stdout.write(f"{'':<8}{'json ms':>9}{'orjson ms':>11}{'speedup':>9}")
+        for label, before, after in rows:
+            self.stdout.write(
+                f"{label:<8}{before:>9.2f}{after:>11.3f}{before / after:>8.1f}x"
+            )
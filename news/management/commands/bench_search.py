@@ -0,0 +1,85 @@
+"""
+Compare the icontains scan against the full-text index behind NewsListAPI.
+
+    python manage.py bench_search --sizes 10000,100000,1000000
+
+Articles are generated inside a transaction that is rolled back at the
+end, so the command is safe to point at a development database.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from news import synthetic
+from news.models import NewsArticle
+from news.search import search_articles, attach_snippets, icontains_filter
+
+from ._bench import rolled_back, timed
+
+
+PAGE_SIZE = 10
+
+
+class Command(BaseCommand):
+    help = "Benchmark news search latency (icontains vs full-text index)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="10000,100000,1000000")
+        parser.add_argument(
+            "--queries",
+            default="election,monsoon flood,cricket captain,startup investment",
+            help="Comma-separated search terms.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--words", type=int, default=250,
+                            help="Average article length in words.")
+
+    def handle(self, *args, **opts):
+        sizes = sorted(int(s) for s in opts["sizes"].split(","))
+        queries = [q.strip() for q in opts["queries"].split(",") if q.strip()]
+
+        with rolled_back():
+            self.run(sizes, queries, opts["repeat"], opts["words"])
+
+    def run(self, sizes, queries, repeat, words):
+        categories = synthetic.ensure_categories(8, prefix="Bench Search")
+        base = NewsArticle.objects.filter(status="published").select_related(
+            "category", "author"
+        )
+
+        self.stdout.write(
+            f"{'articles':>10} {'query':<24} {'icontains ms':>13} "
+            f"{'fts ms':>9} {'speedup':>8} {'hits':>8}"
+        )
+
+        generated = 0
+        for size in sizes:
+            start = time.perf_counter()
+            generated += synthetic.bulk_articles(
+                size - generated, categories, words=words, start=generated,
+                slug_prefix="bench-search",
+            )
+            self.stderr.write(
+                f"generated {size} articles in {time.perf_counter() - start:.1f}s"
+            )
+
+            for q in queries:
+                def scan():
+                    qs = icontains_filter(base, q).order_by("-published_at")
+                    qs.count()
+                    list(qs[:PAGE_SIZE])
+
+                def fts():
+                    qs = search_articles(base, q)
+                    hits = qs.count()
+                    attach_snippets(qs[:PAGE_SIZE], q, using=qs.db)
+                    return hits
+
+                scan_ms = timed(scan, repeat)
+                fts_ms = timed(fts, repeat)
+                hits = search_articles(base, q).count()
+                self.stdout.write(
+                    f"{size:>10} {q:<24} {scan_ms:>13.1f} {fts_ms:>9.1f} "
+                    f"{scan_ms / fts_ms:>7.1f}x {hits:>8}"
+                )
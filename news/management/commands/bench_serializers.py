@@ -0,0 +1,73 @@
+"""
+Throughput of the public read serializers: DRF's ModelSerializer against
+the compiled path in news_backend/serialization.py.
+
+    python manage.py bench_serializers --articles 100 --repeat 20
+
+Rows are loaded once, the way the views load them; only serialization
+is timed. Both paths must render to the same JSON. Everything is rolled
+back.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, Q
+from rest_framework.renderers import JSONRenderer
+
+from authors.models import Author
+from authors.serializers import AuthorSerializer
+from categories.models import Category
+from categories.serializers import CategorySerializer
+from news import synthetic
+from news.models import NewsArticle
+from news.serializers import NewsDetailSerializer, NewsListSerializer, list_queryset
+from news_backend.serialization import compiled
+
+from ._bench import rolled_back, timed
+
+
+class Command(BaseCommand):
+    help = "Time ModelSerializer vs compiled serializers on the public read paths."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--articles", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **opts):
+        with rolled_back():
+            categories = synthetic.ensure_categories(8, prefix="Bench Serializers")
+            synthetic.bulk_articles(opts["articles"], categories, start=22_000_000)
+
+            published = NewsArticle.objects.filter(status="published").order_by("-published_at", "-id")
+            cases = [
+                ("NewsListSerializer", NewsListSerializer,
+                 list(list_queryset(published)[:opts["articles"]])),
+                ("NewsDetailSerializer", NewsDetailSerializer,
+                 list(published.select_related("category", "author")
+                      .prefetch_related("gallery_images")[:opts["articles"]])),
+                ("AuthorSerializer", AuthorSerializer, list(Author.objects.all())),
+                ("CategorySerializer", CategorySerializer, list(
+                    Category.objects.annotate(published_articles=Count(
+                        "articles", filter=Q(articles__status="published")
+                    ))
+                )),
+            ]
+
+            self.stdout.write(
+                f"{'serializer':<22}{'rows':>6}{'drf ms':>9}{'compiled ms':>13}"
+                f"{'rows/s':>11}{'speedup':>9}"
+            )
+            for label, serializer_class, rows in cases:
+                self.run(label, serializer_class, rows, opts["repeat"])
+
+    def run(self, label, serializer_class, rows, repeat):
+        read = compiled(serializer_class)
+        renderer = JSONRenderer()
+        if renderer.render(read.many(rows)) != renderer.render(serializer_class(rows, many=True).data):
+            raise CommandError(f"compiled {label} output differs")
+
+        before = timed(lambda: serializer_class(rows, many=True).data, repeat)
+        after = timed(lambda: read.many(rows), repeat)
+        self.stdout.write(
+            f"{label:<22}{len(rows):>6}{before:>9.2f}{after:>13.2f}"
+            f"{len(rows) / after * 1000:>11,.0f}{before / after:>8.1f}x"
+        )
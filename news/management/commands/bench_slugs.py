@@ -0,0 +1,70 @@
+"""
+Slug allocation under heavy title collisions.
+
+    python manage.py bench_slugs --titles 1000
+
+Creates ``--titles`` articles with the same title twice — once with the
+old exists()-per-candidate loop, once with NewsArticle.generate_unique_slug
+— and reports queries and wall time. Everything is rolled back.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils.text import slugify
+
+from news import synthetic
+from news.models import NewsArticle
+
+from ._bench import QueryCounter, rolled_back
+
+
+def legacy_unique_slug(title):
+    """The pre-allocation loop: one exists() query per taken candidate."""
+    base_slug = slugify(title)
+    slug = base_slug
+    counter = 1
+
+    while NewsArticle.objects.filter(slug=slug).exists():
+        slug = f"{base_slug}-{counter}"
+        counter += 1
+
+    return slug
+
+
+class Command(BaseCommand):
+    help = "Benchmark slug allocation for colliding titles."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--titles", type=int, default=1000)
+        parser.add_argument("--title", default="Live updates")
+
+    def handle(self, *args, **opts):
+        count, title = opts["titles"], opts["title"]
+
+        self.stdout.write(f"{'allocator':<10} {'articles':>9} {'queries':>9} "
+                          f"{'last save q':>12} {'total s':>8} {'ms/save':>8}")
+
+        for label in ("legacy", "prefix"):
+            with rolled_back():
+                category = synthetic.ensure_categories(1, prefix="Bench Slugs")[0]
+                self.run(label, count, title, category)
+
+    def run(self, label, count, title, category):
+        total = QueryCounter()
+        start = time.perf_counter()
+        with connection.execute_wrapper(total):
+            for _ in range(count):
+                before = total.count
+                article = NewsArticle(title=title, content="Body", category=category)
+                if label == "legacy":
+                    article.slug = legacy_unique_slug(title)
+                article.save()
+        elapsed = time.perf_counter() - start
+        last = total.count - before
+
+        self.stdout.write(
+            f"{label:<10} {count:>9} {total.count:>9} {last:>12} "
+            f"{elapsed:>8.2f} {elapsed * 1000 / count:>8.2f}"
+        )
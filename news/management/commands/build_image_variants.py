@@ -0,0 +1,44 @@
+"""
+Backfill responsive image variants.
+
+    python manage.py build_image_variants
+
+Renders the resized copies (news/images.py) of every featured and gallery
+image that has none for its current file: uploads from before the
+pipeline existed, and tasks lost when a worker restarted mid-queue. Runs
+inline, one image at a time.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from news.images import generate_variants
+from news.models import GalleryImage, NewsArticle
+
+
+class Command(BaseCommand):
+    help = "Render missing resized variants of featured and gallery images."
+
+    def handle(self, *args, **opts):
+        start = time.perf_counter()
+        done = failed = 0
+        for model, field in ((NewsArticle, "featured_image"), (GalleryImage, "image")):
+            rows = list(
+                model.objects.exclude(**{field: ""}).exclude(**{f"{field}__isnull": True})
+                .values_list("pk", field, f"{field}_variants")
+            )
+            for pk, name, variants in rows:
+                if (variants or {}).get("source") == name:
+                    continue
+                try:
+                    generate_variants(model, pk, field)
+                    done += 1
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f"{model.__name__} {pk}: {name}: {exc}")
+
+        self.stdout.write(
+            f"variants built for {done} images ({failed} failed) in "
+            f"{time.perf_counter() - start:.1f}s"
+        )
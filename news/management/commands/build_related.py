@@ -0,0 +1,36 @@
+"""
+Rebuild the related-articles index.
+
+    python manage.py build_related
+
+Recomputes every published article's neighbours (news/related.py) and
+saves the TF-IDF index that publishing updates incrementally. Run it
+after bulk imports and periodically, to fold in edits and unpublished
+articles.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from news import related
+
+
+class Command(BaseCommand):
+    help = "Rebuild precomputed related articles for every published article."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--k", type=int, default=related.K,
+                            help="Neighbours kept per article.")
+        parser.add_argument("--path", default=related.INDEX_PATH,
+                            help="Where to save the index.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **opts):
+        start = time.perf_counter()
+        count = related.build_index(k=opts["k"], path=opts["path"], using=opts["database"])
+        self.stdout.write(
+            f"related articles built for {count} articles in "
+            f"{time.perf_counter() - start:.1f}s -> {opts['path']}"
+        )
@@ -0,0 +1,194 @@
+"""
+Import articles from a JSONL or CSV file.
+
+    python manage.py import_articles feed.jsonl --batch-size 1000
+
+Streams the file (see news/importer.py for the record fields) and writes
+each batch with bulk_create in its own transaction, together with the
+category counters, list cards and cache invalidation that save() signals
+would have done. Categories and authors are matched in memory;
+``--create-categories`` adds unknown categories instead of skipping the
+record. A record whose author is unknown is imported without one, with a
+warning, and counted in the summary. The related-articles index is
+rebuilt at the end.
+
+Progress is checkpointed to ``<file>.checkpoint`` after every committed
+batch: running the same command again resumes after the last one
+(``--restart`` starts over). Each batch also writes a pending checkpoint
+just before its COMMIT, naming the batch's last row; if the process dies
+between the two writes, resuming checks whether that row exists and
+skips the batch only if it committed.
+"""
+
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from categories.models import Category
+from news import related
+from news.cards import refresh_cards
+from news.importer import (
+    Lookups, RecordError, SlugAllocator, base_slug, build_article,
+    published_deltas, read_records, set_published_at,
+)
+from news.models import NewsArticle
+from news_backend.cache import invalidate
+
+
+class Command(BaseCommand):
+    help = "Bulk import articles from JSONL or CSV, resumably."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=("jsonl", "csv"),
+                            help="Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--status", default="draft",
+                            choices=[s for s, _ in NewsArticle.STATUS_CHOICES],
+                            help="Status of records that name none (\"scheduled\" "
+                                 "needs a scheduled_at per record).")
+        parser.add_argument("--create-categories", action="store_true")
+        parser.add_argument("--checkpoint",
+                            help="Checkpoint file (default <path>.checkpoint).")
+        parser.add_argument("--restart", action="store_true",
+                            help="Ignore an existing checkpoint.")
+        parser.add_argument("--skip-related", action="store_true",
+                            help="Don't rebuild the related-articles index.")
+
+    def handle(self, *args, **opts):
+        path = os.path.abspath(opts["path"])
+        if not os.path.exists(path):
+            raise CommandError(f"{path} does not exist")
+        self.checkpoint_path = opts["checkpoint"] or f"{path}.checkpoint"
+        self.state = self.load_checkpoint(path, opts["restart"])
+        self.opts = opts
+
+        self.lookups = Lookups(create_categories=opts["create_categories"])
+        self.slugs = SlugAllocator()
+        self.published = 0
+        resumed_at = self.state["records"]
+        if resumed_at:
+            self.stderr.write(f"resuming after record {resumed_at}")
+
+        self.started = time.perf_counter()
+        self.imported = 0
+        records = read_records(path, opts["format"])
+        for _ in zip(range(resumed_at), records):
+            pass  # already imported
+
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) == opts["batch_size"]:
+                self.write_batch(batch)
+                batch = []
+        if batch:
+            self.write_batch(batch)
+
+        elapsed = time.perf_counter() - self.started
+        if self.published and not opts["skip_related"]:
+            start = time.perf_counter()
+            count = related.build_index()
+            self.stderr.write(
+                f"related index rebuilt for {count} articles in {time.perf_counter() - start:.1f}s"
+            )
+
+        self.stdout.write(
+            f"imported {self.imported} articles ({self.published} published) in "
+            f"{elapsed:.1f}s, {self.imported / max(elapsed, 1e-9):.0f} rows/s; "
+            f"{self.state['failed']} records skipped and "
+            f"{self.state['unattributed']} without their unknown author in total"
+        )
+
+    # -------------------------------------------------
+    # Checkpoint
+    # -------------------------------------------------
+    def load_checkpoint(self, path, restart):
+        fresh = {"path": path, "records": 0, "imported": 0, "failed": 0, "unattributed": 0}
+        if restart or not os.path.exists(self.checkpoint_path):
+            return fresh
+        with open(self.checkpoint_path) as fh:
+            state = json.load(fh)
+        if state.get("path") != path:
+            raise CommandError(
+                f"{self.checkpoint_path} belongs to {state.get('path')}; "
+                "pass --checkpoint or --restart"
+            )
+        pending = state.pop("pending", None)
+        if pending and NewsArticle.objects.filter(
+            pk=pending["pk"], slug=pending["slug"]
+        ).exists():
+            state = pending["state"]  # the batch committed after all
+        state.setdefault("unattributed", 0)  # checkpoints from before the count
+        return state
+
+    def save_checkpoint(self, state):
+        tmp = f"{self.checkpoint_path}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump(state, fh)
+        os.replace(tmp, self.checkpoint_path)
+
+    # -------------------------------------------------
+    # Batches
+    # -------------------------------------------------
+    def write_batch(self, records):
+        before = dict(self.state)
+        first = self.state["records"] + 1
+        rows = []
+        for number, record in enumerate(records, first):
+            try:
+                article, published_at = build_article(record, self.lookups, self.opts["status"])
+            except RecordError as exc:
+                self.state["failed"] += 1
+                self.stderr.write(f"record {number}: {exc}")
+                continue
+            rows.append((article, published_at))
+            author = (record.get("author") or "").strip()
+            if author and article.author_id is None:
+                self.state["unattributed"] += 1
+                self.stderr.write(f"record {number}: unknown author {author!r}, imported without one")
+
+        articles = [article for article, _ in rows]
+        bases = [base_slug(article) for article in articles]
+        self.slugs.prime(bases)
+        for article, base in zip(articles, bases):
+            article.slug = self.slugs.allocate(base)
+
+        with transaction.atomic():
+            NewsArticle.objects.bulk_create(articles)
+
+            set_published_at([(a, when) for a, when in rows if when is not None])
+
+            # bulk_create skipped the signals: redo their work.
+            published = [a for a in articles if a.status == "published"]
+            if published:
+                refresh_cards(NewsArticle.objects.filter(pk__in=[a.pk for a in published]))
+                deltas = published_deltas(published)
+                Category.adjust_published_counts(deltas)
+                invalidate(
+                    "news:list", "categories",
+                    *(["news:featured"] if any(a.is_featured for a in published) else []),
+                    *(f"news:category:{self.lookups.category_slugs[pk]}" for pk in deltas),
+                )
+
+            self.state["records"] += len(records)
+            self.state["imported"] += len(articles)
+            if articles:
+                last = articles[-1]
+                self.save_checkpoint({
+                    **before,
+                    "pending": {"state": self.state, "pk": last.pk, "slug": last.slug},
+                })
+
+        self.published += len(published)
+        self.imported += len(articles)
+        self.save_checkpoint(self.state)
+
+        elapsed = time.perf_counter() - self.started
+        self.stderr.write(
+            f"{self.state['records']} records, {self.imported} imported, "
+            f"{self.imported / max(elapsed, 1e-9):.0f} rows/s"
+        )
@@ -0,0 +1,54 @@
+"""
+Publish scheduled articles that are due.
+
+    python manage.py publish_scheduled               # once, e.g. from cron
+    python manage.py publish_scheduled --loop --interval 30
+
+Each tick publishes every due article in batches of ``--batch-size``
+(news/workflow.py publish_due): one indexed SELECT and one UPDATE per
+batch, with category counters, list cards and the response cache
+refreshed once per batch rather than once per article. ``--loop`` keeps
+ticking until interrupted; several schedulers may run side by side on
+databases with SKIP LOCKED.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from news import workflow
+
+
+class Command(BaseCommand):
+    help = "Publish scheduled articles whose time has come."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--loop", action="store_true",
+                            help="Keep running, one tick every --interval seconds.")
+        parser.add_argument("--interval", type=float, default=30.0)
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **opts):
+        if not opts["loop"]:
+            self.stdout.write(f"published {self.tick(opts['batch_size'])} scheduled articles")
+            return
+
+        try:
+            while True:
+                started = time.monotonic()
+                close_old_connections()
+                published = self.tick(opts["batch_size"])
+                if published:
+                    self.stdout.write(f"published {published} scheduled articles")
+                time.sleep(max(0.0, opts["interval"] - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            pass
+
+    def tick(self, batch_size):
+        total = 0
+        while True:
+            published = workflow.publish_due(limit=batch_size)
+            total += published
+            if published < batch_size:
+                return total
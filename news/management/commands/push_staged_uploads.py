@@ -0,0 +1,30 @@
+"""
+Push staged uploads that never reached object storage.
+
+    python manage.py push_staged_uploads
+
+Uploads wait under STAGED_UPLOAD_ROOT until the background uploader
+(news_backend/storage.py) copies them to remote storage. Files are left
+behind when every retry failed or the process stopped first; run this on
+the host that staged them (at boot, or from cron) to push them inline.
+"""
+
+from django.core.files.storage import storages
+from django.core.management.base import BaseCommand, CommandError
+
+from news_backend.storage import StagedStorage
+
+
+class Command(BaseCommand):
+    help = "Push every staged upload to remote storage."
+
+    def handle(self, *args, **opts):
+        storage = storages["default"]
+        if not isinstance(storage, StagedStorage):
+            raise CommandError("the default storage does not stage uploads")
+
+        names = storage.pending()
+        failed = [name for name in names if not storage.push(name)]
+        for name in failed:
+            self.stderr.write(f"still staged: {name}")
+        self.stdout.write(f"pushed {len(names) - len(failed)} of {len(names)} staged uploads")
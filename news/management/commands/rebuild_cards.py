@@ -0,0 +1,51 @@
+"""
+Rebuild the precomputed list cards.
+
+    python manage.py rebuild_cards
+    python manage.py rebuild_cards --missing
+
+Re-renders every published article's list card (news/cards.py) and
+clears any card left on an unpublished one, then retires the cached list
+responses that embed them. Run it after a change to NewsListSerializer
+or its media URLs; ``--missing`` only fills in cards that are not built
+yet, which cards_for() would otherwise do on first request.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from categories.models import Category
+from news.cards import refresh_cards
+from news.models import NewsArticle
+from news_backend.cache import invalidate
+
+
+class Command(BaseCommand):
+    help = "Rebuild the precomputed list card of every published article."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--missing", action="store_true",
+                            help="Only build cards that do not exist yet.")
+
+    def handle(self, *args, **opts):
+        start = time.perf_counter()
+        articles = NewsArticle.objects.all()
+        if opts["missing"]:
+            articles = articles.filter(list_card=None)
+
+        # Batches commit as they go (refresh_cards), so writers are never
+        # held up for the whole table.
+        cleared = (
+            NewsArticle.objects.exclude(status="published")
+            .exclude(list_card=None).update(list_card=None)
+        )
+        built = refresh_cards(articles)
+        invalidate(
+            "news:list", "news:featured",
+            *(f"news:category:{slug}" for slug in Category.objects.values_list("slug", flat=True)),
+        )
+
+        self.stdout.write(
+            f"{built} cards built, {cleared} cleared in {time.perf_counter() - start:.1f}s"
+        )
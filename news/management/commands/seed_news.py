@@ -0,0 +1,113 @@
+"""
+Fill a local database with realistic synthetic news data.
+
+    python manage.py seed_news --articles 50000 --authors 80 --categories 12
+
+Articles get 300-900 word bodies (``--words`` is the average), a mix of
+published / review / draft statuses and up to ``--gallery`` gallery
+images each (storage names only, nothing is uploaded). Running it again
+adds more rows; ``--flush`` removes earlier synthetic data first.
+
+Rows are bulk inserted, so the command does the signal work itself:
+category counters, list cards and the response cache.
+"""
+
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Max
+
+from categories.models import Category
+from news import synthetic
+from news.cards import refresh_cards
+from news.models import NewsArticle
+from news_backend.cache import invalidate
+
+
+CATEGORY_PREFIX = "Synthetic"
+AUTHOR_PREFIX = "synthetic-author"
+SLUG_PREFIX = "synthetic-"
+
+# Share of generated articles per status.
+STATUS_MIX = (("published", 0.85), ("review", 0.05), ("draft", 0.10))
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic categories, authors, articles and gallery images."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--categories", type=int, default=12)
+        parser.add_argument("--authors", type=int, default=50)
+        parser.add_argument("--articles", type=int, default=10000)
+        parser.add_argument("--words", type=int, default=600,
+                            help="Average article length in words.")
+        parser.add_argument("--gallery", type=int, default=4,
+                            help="Maximum gallery images per article.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--flush", action="store_true",
+                            help="Delete previously generated data first.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument("--noinput", "--no-input", action="store_false",
+                            dest="interactive")
+
+    def handle(self, *args, **opts):
+        database = opts["database"]
+        if opts["interactive"]:
+            name = connections[database].settings_dict["NAME"]
+            answer = input(
+                f"This writes {opts['articles']} synthetic articles to the "
+                f"'{database}' database ({name}). Type 'yes' to continue: "
+            )
+            if answer != "yes":
+                raise CommandError("Seeding cancelled.")
+
+        with transaction.atomic(using=database):
+            if opts["flush"]:
+                self.flush()
+            self.seed(opts)
+
+    def flush(self):
+        articles, _ = NewsArticle.objects.filter(slug__startswith=SLUG_PREFIX).delete()
+        Category.objects.filter(name__startswith=CATEGORY_PREFIX).delete()
+        User.objects.filter(username__startswith=AUTHOR_PREFIX).delete()
+        self.stderr.write(f"flushed {articles} synthetic rows")
+
+    def seed(self, opts):
+        started = time.perf_counter()
+
+        categories = synthetic.ensure_categories(opts["categories"], prefix=CATEGORY_PREFIX)
+        authors = synthetic.ensure_authors(opts["authors"], prefix=AUTHOR_PREFIX)
+        self.stderr.write(f"{len(categories)} categories, {len(authors)} authors")
+
+        last_pk = NewsArticle.objects.aggregate(last=Max("pk"))["last"] or 0
+        start = NewsArticle.objects.filter(slug__startswith=SLUG_PREFIX).count()
+        offset = start
+        for status, share in STATUS_MIX:
+            count = round(opts["articles"] * share)
+            offset += synthetic.bulk_articles(
+                count, categories, authors, words=opts["words"], status=status,
+                seed=opts["seed"], start=offset,
+            )
+            self.stderr.write(f"{offset - start} articles ({status} done)")
+
+        created = NewsArticle.objects.filter(pk__gt=last_pk)
+        images = synthetic.bulk_gallery_images(
+            created.only("pk", "slug").order_by("pk").iterator(),
+            opts["gallery"], seed=opts["seed"],
+        )
+        self.stderr.write(f"{images} gallery images")
+
+        # bulk_create skipped the signals: redo their work.
+        Category.recount_published()
+        cards = refresh_cards(created)
+        invalidate(
+            "news:list", "news:featured", "categories",
+            *(f"news:category:{c.slug}" for c in categories),
+        )
+
+        self.stdout.write(
+            f"seeded {offset - start} articles ({cards} published) in "
+            f"{time.perf_counter() - started:.1f}s"
+        )
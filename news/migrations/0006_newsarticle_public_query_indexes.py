@@ -0,0 +1,25 @@
+# Generated by Django 4.2.11 on 2026-10-18 10:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_article_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['status', 'published_at', 'id'], name='news_status_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['status', 'category', 'published_at', 'id'], name='news_status_cat_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['status', 'published_at', 'id'], name='news_featured_pub_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_newsarticle_public_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newsarticle',
+            name='list_card',
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+    ]
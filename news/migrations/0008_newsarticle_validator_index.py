@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_newsarticle_list_card'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['status', 'category', 'updated_at'], name='news_status_cat_upd_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.11 on 2026-10-18 11:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0009_relatedarticle'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='galleryimage',
+            name='image_variants',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='newsarticle',
+            name='featured_image_variants',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
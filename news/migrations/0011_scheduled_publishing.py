@@ -0,0 +1,31 @@
+# Generated by Django 4.2.11 on 2026-10-18 11:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0010_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='newsarticle',
+            name='scheduled_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='newsarticle',
+            name='status',
+            field=models.CharField(choices=[('draft', 'Draft'), ('review', 'Under Review'), ('scheduled', 'Scheduled'), ('published', 'Published')], default='draft', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['status', 'scheduled_at', 'id'], name='news_status_scheduled_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='newsarticle',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('status', 'scheduled'), _negated=True), ('scheduled_at__isnull', False), _connector='OR'), name='news_scheduled_has_time'),
+        ),
+    ]
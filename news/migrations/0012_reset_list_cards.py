@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+def reset_list_cards(apps, schema_editor):
+    # Cards built before 0010 lack featured_image_variants/_srcset.
+    # cards_for() rebuilds a missing card on first use.
+    NewsArticle = apps.get_model("news", "NewsArticle")
+    NewsArticle.objects.using(schema_editor.connection.alias).exclude(
+        list_card=None
+    ).update(list_card=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0011_scheduled_publishing'),
+    ]
+
+    operations = [
+        migrations.RunPython(reset_list_cards, migrations.RunPython.noop),
+    ]
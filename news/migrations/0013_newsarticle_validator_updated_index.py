@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-18 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0012_reset_list_cards'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsarticle',
+            index=models.Index(fields=['status', 'updated_at'], name='news_status_upd_idx'),
+        ),
+    ]
@@ -1,4 +1,7 @@
-from django.db import models
+import copy
+import re
+
+from django.db import IntegrityError, models, transaction
 from django.utils.text import slugify
 from django.utils import timezone
 from categories.models import Category
@@ -9,6 +12,7 @@ class NewsArticle(models.Model):
     STATUS_CHOICES = (
         ("draft", "Draft"),
         ("review", "Under Review"),
+        ("scheduled", "Scheduled"),
         ("published", "Published"),
     )
 
@@ -52,6 +56,8 @@ class NewsArticle(models.Model):
         blank=True,
         null=True
     )
+    # Resized copies of featured_image, written by news/images.py
+    featured_image_variants = models.JSONField(null=True, blank=True, editable=False)
 
     # ---------------------------------------------------
     # Flags
@@ -67,34 +73,101 @@ class NewsArticle(models.Model):
         choices=STATUS_CHOICES,
         default="draft"
     )
+    # Set on creation, then again when the article actually goes live.
     published_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # When a "scheduled" article is due; see workflow.publish_due()
+    scheduled_at = models.DateTimeField(null=True, blank=True)
 
     # ---------------------------------------------------
     # Misc
     # ---------------------------------------------------
     reading_time = models.PositiveIntegerField(default=1)  # In minutes
 
+    # Pre-rendered NewsListSerializer output (JSON text) for published
+    # articles; maintained by news/cards.py, NULL until first built.
+    list_card = models.TextField(null=True, blank=True, editable=False)
+
     class Meta:
         ordering = ["-published_at", "-is_breaking", "-is_featured"]
+        # One index per public query shape: equality columns first, then
+        # the sort key, so "newest published" is an index range scan.
+        # The trailing id serves the (published_at, id) keyset order.
+        # Featured is partial: boolean filters compile to a bare
+        # "WHERE is_featured", which only a partial index can match.
+        indexes = [
+            models.Index(
+                fields=["status", "published_at", "id"],
+                name="news_status_published_idx",
+            ),
+            models.Index(
+                fields=["status", "category", "published_at", "id"],
+                name="news_status_cat_pub_idx",
+            ),
+            models.Index(
+                fields=["status", "published_at", "id"],
+                name="news_featured_pub_idx",
+                condition=models.Q(is_featured=True),
+            ),
+            # Conditional GET validators: MAX(updated_at) over published
+            # rows, overall or per category, is one lookup in these.
+            models.Index(
+                fields=["status", "updated_at"],
+                name="news_status_upd_idx",
+            ),
+            models.Index(
+                fields=["status", "category", "updated_at"],
+                name="news_status_cat_upd_idx",
+            ),
+            # The scheduler's "due now" scan, in due order.
+            models.Index(
+                fields=["status", "scheduled_at", "id"],
+                name="news_status_scheduled_idx",
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=~models.Q(status="scheduled") | models.Q(scheduled_at__isnull=False),
+                name="news_scheduled_has_time",
+            ),
+        ]
 
     # ---------------------------------------------------
     # Helper Methods
     # ---------------------------------------------------
 
+    # Attempts to insert with a freshly allocated slug before giving up
+    # (a concurrent create can take the same slug between query and insert)
+    SLUG_INSERT_ATTEMPTS = 5
+
     def generate_unique_slug(self):
         """
         Ensures slug uniqueness by appending incremental numbers.
+
+        One query regardless of collisions: fetch "<base>" and the
+        "<base>-N" slugs (only those: the regex keeps "<base>-other-words"
+        rows in the database) and use the bare base while it is free,
+        else the highest N + 1.
         """
-        base_slug = slugify(self.title)
-        slug = base_slug
-        counter = 1
+        base_slug = slugify(self.title) or "article"
 
-        while NewsArticle.objects.filter(slug=slug).exists():
-            slug = f"{base_slug}-{counter}"
-            counter += 1
+        taken = set(
+            NewsArticle.objects
+            .filter(
+                models.Q(slug=base_slug)
+                | models.Q(
+                    slug__startswith=f"{base_slug}-",  # the index range to scan
+                    slug__regex=rf"^{re.escape(base_slug)}-[0-9]+$",
+                )
+            )
+            .values_list("slug", flat=True)
+        )
+        if base_slug not in taken:
+            return base_slug
 
-        return slug
+        start = len(base_slug) + 1
+        highest = max((int(slug[start:]) for slug in taken if slug != base_slug), default=0)
+        return f"{base_slug}-{highest + 1}"
 
     def calculate_reading_time(self):
         """
@@ -103,23 +176,130 @@ class NewsArticle(models.Model):
         word_count = len(self.content.split())
         return max(1, word_count // 200)
 
+    # ---------------------------------------------------
+    # Dirty-field tracking
+    # ---------------------------------------------------
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._remember_values(fields)
+
+    def _tracked_value(self, field):
+        value = self.__dict__[field.attname]
+        if isinstance(field, models.FileField):
+            return getattr(value, "name", value)
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+    def _remember_values(self, fields=None):
+        """Snapshot the loaded columns (or just ``fields``) as clean."""
+        if fields is None or not hasattr(self, "_loaded_values"):
+            self._loaded_values = {}
+        for field in self._meta.concrete_fields:
+            if fields is not None and field.name not in fields and field.attname not in fields:
+                continue
+            if field.attname in self.__dict__:
+                self._loaded_values[field.attname] = self._tracked_value(field)
+
+    def loaded_value(self, attname, default=None):
+        """Value of ``attname`` as last loaded or saved."""
+        return getattr(self, "_loaded_values", {}).get(attname, default)
+
+    def get_dirty_fields(self):
+        """
+        Names of the fields changed since the row was loaded or last saved;
+        None for unsaved instances (everything is new).
+
+        Deferred fields that were never touched are clean.
+        """
+        loaded = getattr(self, "_loaded_values", None)
+        if self._state.adding or loaded is None:
+            return None
+        dirty = set()
+        for field in self._meta.concrete_fields:
+            if field.attname not in self.__dict__:
+                continue
+            if field.attname not in loaded or loaded[field.attname] != self._tracked_value(field):
+                dirty.add(field.name)
+        return dirty
+
     def save(self, *args, **kwargs):
-        # Auto slug generation
-        if not self.slug:
-            self.slug = self.generate_unique_slug()
+        # Saves of a loaded row write only the dirty columns (plus
+        # updated_at), and derived fields are only recomputed when their
+        # source changes: a status flip doesn't re-split the content.
+        update_fields = kwargs.get("update_fields")
+        changed = self.get_dirty_fields()
+        if update_fields is not None:
+            changed = set(update_fields)
+
+        def touched(*names):
+            return changed is None or any(name in changed for name in names)
+
+        derived = set()
+
+        # Auto slug generation (allocated at insert time, see below)
+        auto_slug = not self.slug and self._state.adding
 
         # Auto SEO title fallback
-        if not self.seo_title:
+        if touched("title", "seo_title") and not self.seo_title:
             self.seo_title = self.title
+            derived.add("seo_title")
 
         # Auto SEO description fallback
-        if not self.seo_description and self.summary:
+        if touched("summary", "seo_description") and not self.seo_description and self.summary:
             self.seo_description = self.summary[:160]
+            derived.add("seo_description")
 
         # Auto reading time
-        self.reading_time = self.calculate_reading_time()
+        if touched("content"):
+            self.reading_time = self.calculate_reading_time()
+            derived.add("reading_time")
+
+        # Going live: published_at is the real publish time, not creation
+        if (
+            touched("status")
+            and self.status == "published"
+            and not self._state.adding
+            and self.loaded_value("status", "published") != "published"
+        ):
+            self.published_at = timezone.now()
+            self.scheduled_at = None
+            derived.update(("published_at", "scheduled_at"))
 
-        super().save(*args, **kwargs)
+        if not auto_slug:
+            if not self.slug:
+                self.slug = self.generate_unique_slug()
+                derived.add("slug")
+            if changed is not None:
+                if update_fields is None:
+                    changed.add("updated_at")
+                kwargs["update_fields"] = changed | derived
+            super().save(*args, **kwargs)
+            self._remember_values()
+            return
+
+        for attempt in range(self.SLUG_INSERT_ATTEMPTS):
+            self.slug = self.generate_unique_slug()
+            try:
+                with transaction.atomic(using=kwargs.get("using")):
+                    super().save(*args, **kwargs)
+                self._remember_values()
+                return
+            except IntegrityError:
+                # Lost the race for this slug: allocate again. Any other
+                # integrity error is not ours to retry.
+                lost_race = (
+                    NewsArticle.objects.filter(slug=self.slug).exists()
+                    and attempt + 1 < self.SLUG_INSERT_ATTEMPTS
+                )
+                if not lost_race:
+                    raise
 
     def __str__(self):
         return self.title
@@ -131,6 +311,8 @@ class GalleryImage(models.Model):
         on_delete=models.CASCADE
     )
     image = models.ImageField(upload_to="news/gallery/")
+    # Resized copies of image, written by news/images.py
+    image_variants = models.JSONField(null=True, blank=True, editable=False)
     caption = models.CharField(max_length=255, blank=True)
     order = models.PositiveIntegerField(default=0)
 
@@ -139,3 +321,31 @@ class GalleryImage(models.Model):
 
     def __str__(self):
         return f"Image for {self.article.title}"
+
+
+class RelatedArticle(models.Model):
+    """
+    One precomputed "related story" link, written by news/related.py.
+    """
+    article = models.ForeignKey(
+        NewsArticle,
+        related_name="related_links",
+        on_delete=models.CASCADE
+    )
+    related = models.ForeignKey(
+        NewsArticle,
+        related_name="related_backlinks",
+        on_delete=models.CASCADE
+    )
+    score = models.FloatField()  # cosine similarity, 0..1
+
+    class Meta:
+        ordering = ["article", "-score"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["article", "related"], name="news_related_unique"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id} -> {self.related_id} ({self.score:.3f})"
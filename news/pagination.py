@@ -0,0 +1,94 @@
+"""
+Pagination for the public news lists.
+
+Page-number pagination stays the default so existing clients keep their
+``count`` / ``next`` / ``previous`` envelope. Infinite-scroll clients opt
+in to keyset pagination by sending ``?cursor=`` (empty on the first page).
+"""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class PublishedKeysetPagination(CursorPagination):
+    """
+    Keyset pagination on ``(published_at, id)``, newest first.
+
+    Each page is one ``LIMIT page_size + 1`` range query starting after
+    the last row of the previous page — no COUNT and no OFFSET, so page
+    1000 costs the same as page 1. Forward-only: ``previous`` is null.
+    """
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-published_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+
+        queryset = queryset.order_by(*self.ordering)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            published_at, pk = position
+            # published_at <= p bounds the index range; the OR breaks ties.
+            queryset = queryset.filter(
+                Q(published_at__lte=published_at)
+                & (Q(published_at__lt=published_at) | Q(id__lt=pk))
+            )
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            raw = urlsafe_b64decode(encoded.encode("ascii")).decode("ascii")
+            published_at, pk = raw.rsplit("|", 1)
+            published_at = parse_datetime(published_at)
+            pk = int(pk)
+        except (Base64Error, UnicodeError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if published_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return published_at, pk
+
+    def encode_cursor(self, instance):
+        raw = f"{instance.published_at.isoformat()}|{instance.pk}"
+        encoded = urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self):
+        return None
+
+
+def get_list_paginator(request):
+    """Keyset pagination when the client asks for it, page numbers otherwise."""
+    if PublishedKeysetPagination.cursor_query_param in request.query_params:
+        return PublishedKeysetPagination()
+    return StandardResultsSetPagination()
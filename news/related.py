@@ -0,0 +1,411 @@
+"""
+Related articles: TF-IDF vectors and precomputed cosine neighbours.
+
+``build_index()`` vectorizes every published article (title, summary and
+content; title terms count triple, summary double), finds each one's
+top-K most similar articles with sparse matrix products and stores them
+as RelatedArticle rows. ``/api/news/<slug>/related/`` only reads those
+rows.
+
+The vectors, vocabulary and IDF weights are saved to RELATED_INDEX_PATH
+so ``add_article()`` can slot a newly published article in without a
+rebuild: it is scored against the saved matrix, gets its own neighbours
+and displaces weaker neighbours of the articles it resembles; a
+re-published article replaces its old row. Edits and unpublishing are
+left to the next full build (``build_related``); the endpoint filters out
+unpublished neighbours meanwhile.
+
+Writers of the saved index (builds and background updates, in any
+process) take an exclusive lock on ``<path>.lock`` and read the file
+afresh under it, so one update never overwrites another.
+"""
+
+import fcntl
+import os
+import re
+import tempfile
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+
+import numpy as np
+from django.conf import settings
+from django.db import connections, transaction
+from scipy import sparse
+
+from news_backend.cache import invalidate
+from news_backend.tasks import submit_on_commit
+
+from .models import NewsArticle, RelatedArticle
+
+
+K = getattr(settings, "RELATED_ARTICLES_K", 8)
+INDEX_PATH = getattr(settings, "RELATED_INDEX_PATH", None)
+
+# Terms kept per document (highest TF-IDF weight first). Bounds both the
+# index size and the cost of the similarity products.
+MAX_TERMS = 48
+# Terms in fewer documents than MIN_DF carry no similarity signal;
+# terms in more than MAX_DF of them are effectively stop words.
+MIN_DF = 2
+MAX_DF = 0.2
+
+# Term count multipliers for title, summary and content.
+FIELD_WEIGHTS = (3, 2, 1)
+
+# Rows per similarity block: the block product is block x articles.
+_BLOCK = 256
+_CHUNK = 2000
+
+_TOKEN = re.compile(r"[^\W\d_]{3,}")
+STOP_WORDS = frozenset("""
+    about above after again against all also and any are because been before
+    being below between both but can could did does doing down during each
+    few for from further had has have having her here hers herself him
+    himself his how into its itself just more most not now off once only
+    other our ours out over own same she should some such than that the
+    their theirs them then there these they this those through too under
+    until very was were what when where which while who whom why will with
+    would you your yours said says say new one two also
+""".split())
+
+
+def term_counts(title, summary, content):
+    counts = Counter()
+    for weight, text in zip(FIELD_WEIGHTS, (title, summary, content)):
+        terms = _TOKEN.findall((text or "").lower())
+        for _ in range(weight):
+            counts.update(terms)
+    for term in STOP_WORDS.intersection(counts):
+        del counts[term]
+    return counts
+
+
+# -------------------------------------------------
+# Vectors
+# -------------------------------------------------
+def _weigh(matrix, idf):
+    """Sublinear TF x IDF, top MAX_TERMS per row, L2-normalized rows."""
+    matrix = matrix.tocsr().astype(np.float32)
+    matrix.data = 1 + np.log(matrix.data)
+    matrix = matrix @ sparse.diags(idf.astype(np.float32))
+    matrix = _top_terms(matrix.tocsr())
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.csr_matrix(sparse.diags(1 / norms) @ matrix, dtype=np.float32)
+
+
+def _top_terms(matrix):
+    indptr, indices, data = [0], [], []
+    for row in range(matrix.shape[0]):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        cols, vals = matrix.indices[start:end], matrix.data[start:end]
+        if len(vals) > MAX_TERMS:
+            keep = np.argpartition(vals, -MAX_TERMS)[-MAX_TERMS:]
+            cols, vals = cols[keep], vals[keep]
+        indices.append(cols)
+        data.append(vals)
+        indptr.append(indptr[-1] + len(vals))
+
+    return sparse.csr_matrix(
+        (np.concatenate(data) if data else np.empty(0, np.float32),
+         np.concatenate(indices) if indices else np.empty(0, np.int32),
+         np.asarray(indptr)),
+        shape=matrix.shape,
+    )
+
+
+class _Vocabulary(dict):
+    """term -> column, numbering unseen terms as they arrive."""
+
+    def __missing__(self, term):
+        col = self[term] = len(self)
+        return col
+
+
+def _count_matrix(rows, vocabulary, grow):
+    """CSR term counts for (title, summary, content) rows."""
+    ids = array("q")
+    indptr, indices, counts = array("q", [0]), array("i"), array("f")
+    for pk, title, summary, content in rows:
+        terms = term_counts(title, summary, content)
+        if grow:
+            indices.extend([vocabulary[t] for t in terms])
+            counts.extend(terms.values())
+        else:
+            known = [(vocabulary[t], n) for t, n in terms.items() if t in vocabulary]
+            indices.extend([col for col, _ in known])
+            counts.extend([n for _, n in known])
+        ids.append(pk)
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.frombuffer(counts, np.float32), np.frombuffer(indices, np.int32),
+         np.frombuffer(indptr, np.int64)),
+        shape=(len(ids), len(vocabulary)),
+    )
+    return np.frombuffer(ids, np.int64), matrix
+
+
+def _top_neighbours(similarity, k):
+    """(column indices, scores) of the k best entries per row of a dense block."""
+    k = min(k, similarity.shape[1])
+    if k == 0:
+        empty = np.empty((similarity.shape[0], 0))
+        return empty.astype(np.int64), empty
+    best = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+    scores = np.take_along_axis(similarity, best, axis=1)
+    order = np.argsort(-scores, axis=1)
+    return np.take_along_axis(best, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+
+# -------------------------------------------------
+# Saved index
+# -------------------------------------------------
+class Index:
+    def __init__(self, ids, matrix, terms, idf, database):
+        self.ids = ids
+        self.matrix = matrix
+        self.terms = terms
+        self.idf = idf
+        self.database = database
+        self.vocabulary = {term: col for col, term in enumerate(terms)}
+
+    def save(self, path):
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # Write then rename, so readers never see a half-written file.
+        with tempfile.NamedTemporaryFile(dir=directory, suffix=".npz", delete=False) as fh:
+            np.savez(
+                fh, ids=self.ids, terms=np.asarray(self.terms, dtype=str),
+                idf=self.idf, database=np.asarray(self.database),
+                data=self.matrix.data, indices=self.matrix.indices,
+                indptr=self.matrix.indptr, shape=np.asarray(self.matrix.shape),
+            )
+        os.replace(fh.name, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as saved:
+            matrix = sparse.csr_matrix(
+                (saved["data"], saved["indices"], saved["indptr"]),
+                shape=tuple(saved["shape"]),
+            )
+            return cls(saved["ids"], matrix, saved["terms"].tolist(),
+                       saved["idf"], str(saved["database"]))
+
+
+@contextmanager
+def locked(path):
+    """Hold the writers' lock of the index at ``path``."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with open(f"{path}.lock", "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _database_name(using):
+    return str(connections[using].settings_dict["NAME"])
+
+
+# -------------------------------------------------
+# Full build
+# -------------------------------------------------
+def build_index(k=K, path=None, using="default"):
+    """
+    Rebuild every article's neighbours; returns the number of articles.
+
+    Replaces all RelatedArticle rows and the saved index at ``path``.
+    """
+    path = path or INDEX_PATH
+    rows = (
+        NewsArticle.objects.using(using)
+        .filter(status="published")
+        .order_by("pk")
+        .values_list("pk", "title", "summary", "content")
+        .iterator(chunk_size=_CHUNK)
+    )
+    vocabulary = _Vocabulary()
+    ids, counts = _count_matrix(rows, vocabulary, grow=True)
+    n = len(ids)
+
+    # Document frequencies, then drop uninformative terms.
+    df = np.bincount(counts.indices, minlength=len(vocabulary))
+    keep = (df >= MIN_DF) & (df <= max(MIN_DF, MAX_DF * n))
+    columns = np.flatnonzero(keep)
+    counts = counts[:, columns]
+    terms = np.asarray(sorted(vocabulary, key=vocabulary.get), dtype=object)[columns]
+    idf = (np.log((1 + n) / (1 + df[columns])) + 1).astype(np.float32)
+
+    matrix = _weigh(counts, idf)
+    index = Index(ids, matrix, terms.tolist(), idf, _database_name(using))
+
+    # Score everything before touching the table, so the write
+    # transaction stays short.
+    transposed = matrix.T.tocsr()
+    neighbours = np.zeros((n, k), dtype=np.int64)
+    scores = np.zeros((n, k), dtype=np.float32)
+    for start in range(0, n, _BLOCK):
+        block = (matrix[start:start + _BLOCK] @ transposed).toarray()
+        # An article is not its own neighbour.
+        block[np.arange(block.shape[0]), np.arange(start, start + block.shape[0])] = 0
+        best, values = _top_neighbours(block, k)
+        neighbours[start:start + len(best), :best.shape[1]] = ids[best]
+        scores[start:start + len(best), :best.shape[1]] = values
+
+    rows = np.repeat(ids, k)
+    found = scores.ravel() > 0
+    links = zip(
+        rows[found].tolist(), neighbours.ravel()[found].tolist(),
+        scores.ravel()[found].tolist(),
+    )
+    with transaction.atomic(using=using):
+        RelatedArticle.objects.using(using).all().delete()
+        _insert_links(links, using)
+
+    if path:
+        with locked(path):
+            index.save(path)
+    invalidate("news:list")
+    return n
+
+
+def _insert_links(links, using):
+    """
+    Insert (article_id, related_id, score) tuples. A full build writes
+    K rows per article, too many to build a model instance for each.
+    """
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    sql = "INSERT INTO {} ({}, {}, {}) VALUES (%s, %s, %s)".format(
+        quote(RelatedArticle._meta.db_table),
+        quote("article_id"), quote("related_id"), quote("score"),
+    )
+    with connection.cursor() as cursor:
+        batch = []
+        for link in links:
+            batch.append(link)
+            if len(batch) == _CHUNK:
+                cursor.executemany(sql, batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+
+
+# -------------------------------------------------
+# Incremental update
+# -------------------------------------------------
+def add_article(article, k=K, path=None, using="default"):
+    """
+    Give a newly published article neighbours from the saved index and
+    offer it as a neighbour to the articles it resembles. No-op (False)
+    without an index built from this database.
+    """
+    return add_articles([article], k=k, path=path, using=using) > 0
+
+
+def add_articles(articles, k=K, path=None, using="default"):
+    """add_article() for several articles, saving the index once; returns how many."""
+    path = path or INDEX_PATH
+    if not path or not os.path.exists(path):
+        return 0
+
+    with locked(path):
+        # Read under the lock: another writer may have saved since.
+        index = Index.load(path)
+        if index.database != _database_name(using):
+            return 0
+        for article in articles:
+            _add(index, article, k, using)
+        index.save(path)
+
+    invalidate("news:list")
+    return len(articles)
+
+
+def _add(index, article, k, using):
+    _, counts = _count_matrix(
+        [(article.pk, article.title, article.summary, article.content)],
+        index.vocabulary, grow=False,
+    )
+    vector = _weigh(counts, index.idf)
+    scores = (index.matrix @ vector.T).toarray().ravel()
+    scores[index.ids == article.pk] = 0   # a re-publish: its old row
+
+    # Over-fetch: the index still holds articles deleted or unpublished
+    # since the last build, and those must not be linked.
+    best, values = _top_neighbours(scores[np.newaxis, :], k * 4)
+    ranked, seen = [], set()
+    for col, score in zip(best[0], values[0]):
+        pk = int(index.ids[col])
+        if score > 0 and pk not in seen:
+            seen.add(pk)
+            ranked.append((pk, float(score)))
+    live = set(
+        NewsArticle.objects.using(using)
+        .filter(pk__in=[pk for pk, _ in ranked], status="published")
+        .values_list("pk", flat=True)
+    )
+    candidates = [(pk, score) for pk, score in ranked if pk in live][:k]
+
+    with transaction.atomic(using=using):
+        links = RelatedArticle.objects.using(using)
+        links.filter(article=article).delete()
+        links.bulk_create([
+            RelatedArticle(article_id=article.pk, related_id=pk, score=score)
+            for pk, score in candidates
+        ])
+        _offer_as_neighbour(article.pk, candidates, k, using)
+
+    # Replace, never duplicate, the article's row.
+    keep = np.flatnonzero(index.ids != article.pk)
+    index.ids = np.append(index.ids[keep], article.pk)
+    index.matrix = sparse.vstack([index.matrix[keep], vector], format="csr")
+
+
+def _offer_as_neighbour(article_id, candidates, k, using):
+    """Similarity is symmetric: insert ``article_id`` where it beats the k-th."""
+    links = RelatedArticle.objects.using(using)
+    existing = {}
+    for row in (
+        links.filter(article_id__in=[pk for pk, _ in candidates])
+        .exclude(related_id=article_id)
+        .values_list("article_id", "pk", "score")
+    ):
+        existing.setdefault(row[0], []).append(row[1:])
+
+    added, dropped = [], []
+    for pk, score in candidates:
+        current = sorted(existing.get(pk, []), key=lambda link: link[1])
+        if len(current) >= k:
+            weakest_pk, weakest = current[0]
+            if score <= weakest:
+                continue
+            dropped.append(weakest_pk)
+        added.append(RelatedArticle(article_id=pk, related_id=article_id, score=score))
+
+    links.filter(pk__in=dropped).delete()
+    links.filter(article_id__in=[link.article_id for link in added],
+                 related_id=article_id).delete()
+    links.bulk_create(added)
+
+
+def _add_published(article_ids):
+    articles = NewsArticle.objects.filter(pk__in=article_ids, status="published")
+    add_articles(list(articles.only("pk", "title", "summary", "content")))
+
+
+def schedule_add_many(article_ids):
+    """Index published articles in the background after commit."""
+    if INDEX_PATH and article_ids:
+        submit_on_commit(_add_published, list(article_ids))
+
+
+def schedule_add(article):
+    """schedule_add_many() for one article (the publishing request's)."""
+    schedule_add_many([article.pk])
@@ -0,0 +1,257 @@
+"""
+Full-text search for NewsArticle.
+
+SQLite  -> FTS5 virtual table kept in sync by triggers on the article table.
+Postgres -> GIN index over the same tsvector expression the queries use.
+Any other backend falls back to the old icontains scan.
+"""
+
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+from .models import NewsArticle
+
+
+FTS_TABLE = "news_article_fts"
+PG_INDEX_NAME = "news_article_search_gin"
+PG_CONFIG = "english"
+
+SNIPPET_START = "<mark>"
+SNIPPET_STOP = "</mark>"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+# -------------------------------------------------
+# SQLite FTS5 schema
+# -------------------------------------------------
+def _sqlite_fts_statements(table):
+    return [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+            title, summary, content,
+            content='{table}', content_rowid='id',
+            tokenize='porter unicode61 remove_diacritics 2'
+        )
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, title, summary, content)
+            VALUES (new.id, new.title, new.summary, new.content);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, summary, content)
+            VALUES ('delete', old.id, old.title, old.summary, old.content);
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+        AFTER UPDATE OF title, summary, content ON {table} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, summary, content)
+            VALUES ('delete', old.id, old.title, old.summary, old.content);
+            INSERT INTO {FTS_TABLE}(rowid, title, summary, content)
+            VALUES (new.id, new.title, new.summary, new.content);
+        END
+        """,
+    ]
+
+
+def _sqlite_triggers_missing(cursor):
+    names = [f"{FTS_TABLE}_{suffix}" for suffix in ("ai", "ad", "au")]
+    cursor.execute(
+        "SELECT count(*) FROM sqlite_master "
+        "WHERE type = 'trigger' AND name IN (%s, %s, %s)",
+        names,
+    )
+    return cursor.fetchone()[0] < len(names)
+
+
+def install_search_index(connection, rebuild=True):
+    """
+    Create the backend-specific search index (idempotent).
+
+    Called from the migration and again after every ``migrate`` run:
+    SQLite drops triggers whenever Django remakes the article table, so
+    a missing trigger means the index may be stale and gets rebuilt.
+    """
+    table = NewsArticle._meta.db_table
+
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            missing = _sqlite_triggers_missing(cursor)
+            for sql in _sqlite_fts_statements(table):
+                cursor.execute(sql)
+            if rebuild or missing:
+                cursor.execute(
+                    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+                )
+
+    elif connection.vendor == "postgresql":
+        from django.contrib.postgres.indexes import GinIndex
+
+        with connection.cursor() as cursor:
+            existing = connection.introspection.get_constraints(cursor, table)
+        if PG_INDEX_NAME not in existing:
+            # Built from the query expression so the planner can match it.
+            with connection.schema_editor() as editor:
+                editor.add_index(
+                    NewsArticle, GinIndex(_pg_vector(), name=PG_INDEX_NAME)
+                )
+
+
+def uninstall_search_index(connection):
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+    elif connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX IF EXISTS {PG_INDEX_NAME}")
+
+
+def ensure_search_index(sender, using="default", **kwargs):
+    """post_migrate hook — repair the index without a full rebuild."""
+    from django.db.migrations.recorder import MigrationRecorder
+
+    connection = connections[using]
+    applied = MigrationRecorder(connection).applied_migrations()
+    if ("news", "0005_article_search_index") in applied:
+        install_search_index(connection, rebuild=False)
+
+
+# -------------------------------------------------
+# Querying
+# -------------------------------------------------
+def search_backend(using="default"):
+    vendor = connections[using].vendor
+    if vendor == "sqlite":
+        return "fts5"
+    if vendor == "postgresql":
+        return "postgres"
+    return None
+
+
+def _fts5_match(q):
+    # Quote every token so user input can never hit FTS5 query syntax.
+    # Single letters ("election's" -> "s") only ever narrow the match.
+    tokens = _TOKEN_RE.findall(q)
+    tokens = [t for t in tokens if len(t) > 1] or tokens
+    return " ".join(f'"{token}"' for token in tokens)
+
+
+def _pg_vector():
+    from django.contrib.postgres.search import SearchVector
+
+    # Also the indexed expression — keep queries and index in lockstep.
+    return SearchVector("title", "summary", "content", config=PG_CONFIG)
+
+
+def _pg_query(q):
+    from django.contrib.postgres.search import SearchQuery
+
+    return SearchQuery(q, config=PG_CONFIG, search_type="websearch")
+
+
+def icontains_filter(queryset, q):
+    return queryset.filter(
+        Q(title__icontains=q)
+        | Q(summary__icontains=q)
+        | Q(content__icontains=q)
+    )
+
+
+def search_articles(queryset, q):
+    """
+    Filter ``queryset`` to articles matching ``q``, best matches first.
+    """
+    backend = search_backend(queryset.db)
+
+    if backend == "fts5":
+        match = _fts5_match(q)
+        if not match:
+            return icontains_filter(queryset, q)
+
+        table = NewsArticle._meta.db_table
+        return queryset.extra(
+            select={"search_rank": f"bm25({FTS_TABLE}, 10.0, 4.0, 1.0)"},
+            tables=[FTS_TABLE],
+            where=[
+                f"{FTS_TABLE}.rowid = {table}.id",
+                f"{FTS_TABLE} MATCH %s",
+            ],
+            params=[match],
+        ).order_by("search_rank", "-published_at")
+
+    if backend == "postgres":
+        from django.contrib.postgres.search import SearchRank
+
+        query = _pg_query(q)
+        return (
+            queryset
+            .annotate(search_vector=_pg_vector())
+            .filter(search_vector=query)
+            .annotate(search_rank=SearchRank(_pg_vector(), query))
+            .order_by("-search_rank", "-published_at")
+        )
+
+    return icontains_filter(queryset, q)
+
+
+def attach_snippets(articles, q, using="default"):
+    """
+    Set ``search_snippet`` on each article of an already-sliced page.
+
+    Snippets are computed for the page only, never for the full match set.
+    """
+    articles = list(articles)
+    for article in articles:
+        article.search_snippet = None
+
+    ids = [article.pk for article in articles]
+    if not ids:
+        return articles
+
+    backend = search_backend(using)
+    snippets = {}
+
+    if backend == "fts5":
+        match = _fts5_match(q)
+        if match:
+            placeholders = ", ".join(["%s"] * len(ids))
+            with connections[using].cursor() as cursor:
+                cursor.execute(
+                    f"SELECT rowid, snippet({FTS_TABLE}, -1, %s, %s, '…', 24) "
+                    f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+                    f"AND rowid IN ({placeholders})",
+                    [SNIPPET_START, SNIPPET_STOP, match, *ids],
+                )
+                snippets = dict(cursor.fetchall())
+
+    elif backend == "postgres":
+        from django.contrib.postgres.search import SearchHeadline
+
+        snippets = dict(
+            NewsArticle.objects.using(using)
+            .filter(pk__in=ids)
+            .annotate(snippet=SearchHeadline(
+                "content",
+                _pg_query(q),
+                config=PG_CONFIG,
+                start_sel=SNIPPET_START,
+                stop_sel=SNIPPET_STOP,
+                max_words=35,
+                min_words=15,
+                max_fragments=1,
+            ))
+            .values_list("pk", "snippet")
+        )
+
+    for article in articles:
+        article.search_snippet = snippets.get(article.pk)
+    return articles
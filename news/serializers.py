@@ -3,9 +3,11 @@ Serializers for News module — optimized for frontend UI, SEO, and API performa
 """
 
 from rest_framework import serializers
+from news_backend.media import media_url
+from .images import srcsets, variant_urls
 from .models import NewsArticle, GalleryImage
 from authors.serializers import AuthorSerializer
-from categories.serializers import CategorySerializer
+from categories.serializers import CategorySerializer, CategorySummarySerializer
 
 
 def pretty_date(dt):
@@ -14,37 +16,52 @@ def pretty_date(dt):
     return dt.strftime("%d %b %Y, %I:%M %p")
 
 
+def image_variants(field_file, variants):
+    """Variant URLs plus per-format srcset strings ({} until they are made)."""
+    urls = variant_urls(field_file, variants)
+    return urls, srcsets(urls)
+
+
 # -------------------------------------------------
 # GALLERY IMAGE SERIALIZER (NEW)
 # -------------------------------------------------
 class GalleryImageSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = GalleryImage
         fields = [
             "id",
             "image_url",
+            "image_variants",
+            "image_srcset",
             "caption",
             "order",
         ]
 
     def get_image_url(self, obj):
-        try:
-            if obj.image:
-                return obj.image.url
-        except:
-            pass
-        return None
+        return media_url(obj.image)
+
+    def get_image_variants(self, obj):
+        return image_variants(obj.image, obj.image_variants)[0]
+
+    def get_image_srcset(self, obj):
+        return image_variants(obj.image, obj.image_variants)[1]
 
 
 # -------------------------------------------------
 # NEWS LIST SERIALIZER (UNCHANGED)
 # -------------------------------------------------
+# Its output is stored as NewsArticle.list_card (news/cards.py): a change
+# to the fields needs a migration that clears list_card, like 0012.
 class NewsListSerializer(serializers.ModelSerializer):
     author = AuthorSerializer(read_only=True)
-    category = CategorySerializer(read_only=True)
+    category = CategorySummarySerializer(read_only=True)
     featured_image_url = serializers.SerializerMethodField()
+    featured_image_variants = serializers.SerializerMethodField()
+    featured_image_srcset = serializers.SerializerMethodField()
     read_time = serializers.IntegerField(source="reading_time", read_only=True)
     published_on = serializers.SerializerMethodField()
 
@@ -58,6 +75,8 @@ class NewsListSerializer(serializers.ModelSerializer):
             "category",
             "author",
             "featured_image_url",
+            "featured_image_variants",
+            "featured_image_srcset",
             "published_on",
             "read_time",
             "is_featured",
@@ -65,17 +84,35 @@ class NewsListSerializer(serializers.ModelSerializer):
         ]
 
     def get_featured_image_url(self, obj):
-        try:
-            if obj.featured_image:
-                return obj.featured_image.url
-        except:
-            pass
-        return None
+        return media_url(obj.featured_image)
+
+    def get_featured_image_variants(self, obj):
+        return image_variants(obj.featured_image, obj.featured_image_variants)[0]
+
+    def get_featured_image_srcset(self, obj):
+        return image_variants(obj.featured_image, obj.featured_image_variants)[1]
 
     def get_published_on(self, obj):
         return pretty_date(obj.published_at)
 
 
+# Columns NewsListSerializer reads (status decides whether a card is
+# built). Keep in step with the fields above: news/tests.py fails if the
+# serializer touches anything deferred by list_queryset().
+LIST_COLUMNS = (
+    "id", "title", "slug", "summary", "featured_image", "featured_image_variants",
+    "published_at",
+    "reading_time", "is_featured", "is_breaking", "status",
+    "category__id", "category__name", "category__slug", "category__description",
+    "author__id", "author__name", "author__bio", "author__photo",
+)
+
+
+def list_queryset(queryset):
+    """Join author and category, and load only the list columns (no content)."""
+    return queryset.select_related("category", "author").only(*LIST_COLUMNS)
+
+
 # -------------------------------------------------
 # NEWS DETAIL SERIALIZER (UPDATED)
 # -------------------------------------------------
@@ -83,6 +120,8 @@ class NewsDetailSerializer(serializers.ModelSerializer):
     author = AuthorSerializer(read_only=True)
     category = CategorySerializer(read_only=True)
     featured_image_url = serializers.SerializerMethodField()
+    featured_image_variants = serializers.SerializerMethodField()
+    featured_image_srcset = serializers.SerializerMethodField()
     gallery_images = GalleryImageSerializer(many=True, read_only=True)
     read_time = serializers.IntegerField(source="reading_time", read_only=True)
     published_on = serializers.SerializerMethodField()
@@ -99,6 +138,8 @@ class NewsDetailSerializer(serializers.ModelSerializer):
             "category",
             "author",
             "featured_image_url",
+            "featured_image_variants",
+            "featured_image_srcset",
             "gallery_images",     # ✅ NEW
             "published_on",
             "updated_on",
@@ -110,12 +151,13 @@ class NewsDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_featured_image_url(self, obj):
-        try:
-            if obj.featured_image:
-                return obj.featured_image.url
-        except:
-            pass
-        return None
+        return media_url(obj.featured_image)
+
+    def get_featured_image_variants(self, obj):
+        return image_variants(obj.featured_image, obj.featured_image_variants)[0]
+
+    def get_featured_image_srcset(self, obj):
+        return image_variants(obj.featured_image, obj.featured_image_variants)[1]
 
     def get_published_on(self, obj):
         return pretty_date(obj.published_at)
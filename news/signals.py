@@ -0,0 +1,308 @@
+"""
+Signal handlers — keep denormalized data and caches in step with writes.
+
+Article, gallery, category and author writes update the category counters,
+rebuild the list cards (news/cards.py) that embed them and retire
+exactly the cached responses (news_backend/cache.py) they affect. A
+category or author can be on thousands of cards: those are rebuilt in the
+background after commit (news_backend/tasks.py), and only when a field
+the card shows has changed. New
+featured and gallery uploads queue their resized variants (news/images.py)
+and refresh once a staged upload reaches object storage.
+"""
+
+from collections import Counter, namedtuple
+
+from django.db.models import FileField, Q
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from authors.models import Author
+from categories.models import Category
+from news_backend.cache import invalidate
+from news_backend.storage import upload_finished
+from news_backend.tasks import submit_on_commit
+from .cards import refresh_card, refresh_cards
+from .images import schedule_variants
+from .related import schedule_add
+from .models import NewsArticle, GalleryImage
+
+
+ArticleState = namedtuple("ArticleState", "status category_id slug is_featured")
+_STATE_COLUMNS = ArticleState._fields
+
+
+def _state(article):
+    return ArticleState(
+        article.status, article.category_id, article.slug, article.is_featured
+    )
+
+
+def _published_category(state):
+    if state and state.status == "published":
+        return state.category_id
+    return None
+
+
+def _category_slugs(category_ids):
+    return dict(
+        Category.objects.filter(pk__in=category_ids).values_list("pk", "slug")
+    )
+
+
+def invalidate_article_states(*states, counts_changed=False):
+    """
+    Retire cached responses that showed (or should now show) an article.
+
+    Only published states matter: drafts never reach the public cache.
+    """
+    published = [s for s in states if s and s.status == "published"]
+    if not published:
+        return
+
+    slugs = _category_slugs({s.category_id for s in published})
+    namespaces = {"news:list"}
+    for state in published:
+        namespaces.add(f"news:article:{state.slug}")
+        if state.category_id in slugs:
+            namespaces.add(f"news:category:{slugs[state.category_id]}")
+        if state.is_featured:
+            namespaces.add("news:featured")
+    if counts_changed:
+        namespaces.add("categories")
+
+    invalidate(*namespaces)
+
+
+# -------------------------------------------------
+# NewsArticle
+# -------------------------------------------------
+@receiver(pre_save, sender=NewsArticle)
+def remember_article_state(sender, instance, raw=False, **kwargs):
+    instance._previous_state = None
+    if not instance.pk or raw:
+        return
+    # Loaded instances remember their columns (NewsArticle.from_db); only
+    # rows built by hand, or loaded without these columns, are queried.
+    missing = object()
+    loaded = [instance.loaded_value(name, missing) for name in _STATE_COLUMNS]
+    if missing not in loaded:
+        instance._previous_state = ArticleState(*loaded)
+        return
+    row = (
+        NewsArticle.objects
+        .filter(pk=instance.pk)
+        .values_list(*_STATE_COLUMNS)
+        .first()
+    )
+    instance._previous_state = ArticleState(*row) if row else None
+
+
+@receiver(post_save, sender=NewsArticle)
+def article_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    previous = getattr(instance, "_previous_state", None)
+    current = _state(instance)
+
+    before = _published_category(previous)
+    after = _published_category(current)
+    if before != after:
+        deltas = Counter()
+        deltas[before] -= 1
+        deltas[after] += 1
+        Category.adjust_published_counts(deltas)
+
+    refresh_card(instance)
+    invalidate_article_states(previous, current, counts_changed=before != after)
+
+    if current.status == "published" and (previous is None or previous.status != "published"):
+        schedule_add(instance)
+
+    schedule_variants(instance, "featured_image")
+
+
+@receiver(post_delete, sender=NewsArticle)
+def article_deleted(sender, instance, **kwargs):
+    state = _state(instance)
+    Category.adjust_published_counts({_published_category(state): -1})
+    invalidate_article_states(state, counts_changed=True)
+
+
+# -------------------------------------------------
+# Category
+# -------------------------------------------------
+# Columns of a category / author that list cards show (NewsListSerializer's
+# CategorySummarySerializer and AuthorSerializer).
+CATEGORY_CARD_FIELDS = ("name", "slug", "description")
+AUTHOR_CARD_FIELDS = ("name", "bio", "photo")
+
+
+def _comparable(model, fields, values):
+    # Files by name; an empty file is None or "" depending on the path.
+    return tuple(
+        (getattr(value, "name", value) or "")
+        if isinstance(model._meta.get_field(name), FileField) else value
+        for name, value in zip(fields, values)
+    )
+
+
+def _card_values(instance, fields):
+    return _comparable(type(instance), fields, [getattr(instance, name) for name in fields])
+
+
+def _remember_card_values(instance, fields):
+    instance._previous_card = None
+    if instance.pk:
+        row = type(instance).objects.filter(pk=instance.pk).values_list(*fields).first()
+        if row is not None:
+            instance._previous_card = _comparable(type(instance), fields, row)
+
+
+def _card_changed(instance, fields):
+    previous = getattr(instance, "_previous_card", None)
+    return previous is not None and previous != _card_values(instance, fields)
+
+
+@receiver(pre_save, sender=Category)
+def remember_category_slug(sender, instance, raw=False, **kwargs):
+    instance._previous_slug = None
+    if not raw:
+        _remember_card_values(instance, CATEGORY_CARD_FIELDS)
+        if instance._previous_card:
+            instance._previous_slug = instance._previous_card[CATEGORY_CARD_FIELDS.index("slug")]
+
+
+def _invalidate_category(category):
+    # Category cards are embedded in every article response.
+    invalidate(
+        "categories",
+        f"category:{category.pk}",
+        "news:list",
+        "news:featured",
+        f"news:category:{category.slug}",
+        f"news:category:{getattr(category, '_previous_slug', None) or category.slug}",
+    )
+
+
+def rebuild_category_cards(category_id):
+    """Background task: the cards showing a category, then its responses."""
+    category = Category.objects.filter(pk=category_id).first()
+    if category is not None:
+        refresh_cards(NewsArticle.objects.filter(category=category))
+        # Anything cached from the old cards since the save.
+        _invalidate_category(category)
+
+
+@receiver(post_save, sender=Category)
+def category_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        if _card_changed(instance, CATEGORY_CARD_FIELDS):
+            submit_on_commit(rebuild_category_cards, instance.pk)
+        _invalidate_category(instance)
+
+
+@receiver(post_delete, sender=Category)
+def category_deleted(sender, instance, **kwargs):
+    _invalidate_category(instance)
+
+
+# -------------------------------------------------
+# Author
+# -------------------------------------------------
+def _invalidate_author(author):
+    category_slugs = (
+        NewsArticle.objects
+        .filter(author=author, status="published")
+        .values_list("category__slug", flat=True)
+        .distinct()
+    )
+    invalidate(
+        f"author:{author.pk}",
+        "news:list",
+        "news:featured",
+        *(f"news:category:{slug}" for slug in category_slugs),
+    )
+
+
+def rebuild_author_cards(author_id):
+    """Background task: the cards showing an author, then its responses."""
+    author = Author.objects.filter(pk=author_id).first()
+    if author is not None:
+        refresh_cards(NewsArticle.objects.filter(author=author))
+        _invalidate_author(author)
+
+
+@receiver(pre_save, sender=Author)
+def remember_author_card(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _remember_card_values(instance, AUTHOR_CARD_FIELDS)
+
+
+@receiver(post_save, sender=Author)
+def author_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        if _card_changed(instance, AUTHOR_CARD_FIELDS):
+            submit_on_commit(rebuild_author_cards, instance.pk)
+        _invalidate_author(instance)
+
+
+@receiver(pre_delete, sender=Author)
+def author_deleting(sender, instance, **kwargs):
+    # pre_delete: afterwards the articles' author is already NULL.
+    instance._article_ids = list(
+        NewsArticle.objects.filter(author=instance).values_list("pk", flat=True)
+    )
+    _invalidate_author(instance)
+
+
+@receiver(post_delete, sender=Author)
+def author_deleted(sender, instance, **kwargs):
+    # SET_NULL is a queryset update, so auto_now did not move updated_at.
+    articles = NewsArticle.objects.filter(pk__in=instance._article_ids)
+    articles.update(updated_at=timezone.now())
+    refresh_cards(articles)
+
+
+# -------------------------------------------------
+# GalleryImage
+# -------------------------------------------------
+@receiver(post_save, sender=GalleryImage)
+@receiver(post_delete, sender=GalleryImage)
+def gallery_changed(sender, instance, raw=False, **kwargs):
+    # The gallery is part of the article detail response.
+    if raw:
+        return
+    if kwargs["signal"] is post_save:
+        schedule_variants(instance, "image")
+    _touch_articles(NewsArticle.objects.filter(pk=instance.article_id))
+
+
+def _touch_articles(articles):
+    articles.update(updated_at=timezone.now())
+    invalidate_article_states(
+        *(ArticleState(*row) for row in articles.values_list(*_STATE_COLUMNS))
+    )
+
+
+# -------------------------------------------------
+# Staged uploads
+# -------------------------------------------------
+@receiver(upload_finished)
+def upload_landed(sender, name, **kwargs):
+    # Cards and cached responses rendered the placeholder URL until now.
+    articles = NewsArticle.objects.filter(
+        Q(featured_image=name) | Q(gallery_images__image=name)
+    ).distinct()
+    ids = list(articles.values_list("pk", flat=True))
+    if ids:
+        articles = NewsArticle.objects.filter(pk__in=ids)
+        refresh_cards(articles)
+        _touch_articles(articles)
+
+    # Same photo name, new URL: the card values did not change.
+    for author in Author.objects.filter(photo=name):
+        author.save(update_fields=["updated_at"])
+        submit_on_commit(rebuild_author_cards, author.pk)
@@ -0,0 +1,155 @@
+"""
+Synthetic news data (categories, authors, articles, gallery images) for
+benchmarks and local development.
+
+Rows are written with bulk_create, so nothing here goes through
+NewsArticle.save(); callers that need save() side effects must run them.
+"""
+
+import itertools
+import random
+
+from django.contrib.auth.models import User
+from django.utils.text import slugify
+
+from authors.models import Author
+from categories.models import Category
+
+from .models import NewsArticle, GalleryImage
+
+
+WORDS = (
+    "government minister election budget policy parliament court verdict "
+    "police city council river flood monsoon rain farmers harvest market "
+    "prices inflation rupee stocks company profit startup technology mobile "
+    "internet school students exam results university hospital doctors "
+    "health vaccine cricket match team captain stadium series wicket film "
+    "actor release festival temple traffic metro railway airport flight "
+    "weather heatwave cyclone coast district village water power supply "
+    "road project bridge investment jobs industry export trade summit "
+    "leaders talks border security army protest strike union workers "
+    "teachers salary pension scheme launch report survey data record "
+    "growth decline crisis relief rescue fire accident injured killed "
+    "arrested probe investigation officials sources statement announced"
+).split()
+
+
+# Filler vocabulary with a Zipf-like distribution so topical words stay
+# selective, the way they are in real copy.
+_SYLLABLES = "ka ri to ne sa mu la pe di vo ha ni ru te ma".split()
+VOCABULARY = list(WORDS) + [
+    "".join(parts) for parts in itertools.product(_SYLLABLES, repeat=3)
+]
+_WEIGHTS = list(itertools.accumulate(
+    1.0 / rank for rank in range(1, len(VOCABULARY) + 1)
+))
+random.Random(42).shuffle(VOCABULARY)
+
+
+def sentence(rng, low=8, high=20):
+    words = rng.choices(VOCABULARY, cum_weights=_WEIGHTS, k=rng.randint(low, high))
+    return " ".join(words).capitalize() + "."
+
+
+def paragraph(rng, words):
+    out, count = [], 0
+    while count < words:
+        s = sentence(rng)
+        out.append(s)
+        count += s.count(" ") + 1
+    return " ".join(out)
+
+
+def ensure_categories(count, prefix="Synthetic"):
+    existing = list(Category.objects.filter(name__startswith=prefix))
+    missing = [
+        Category(name=f"{prefix} {i}", slug=slugify(f"{prefix}-{i}"))
+        for i in range(len(existing), count)
+    ]
+    Category.objects.bulk_create(missing)
+    return list(Category.objects.filter(name__startswith=prefix))
+
+
+def ensure_authors(count, prefix="synthetic-author"):
+    """Authors (with their users) named ``<prefix>-<n>``; reuses existing ones."""
+    existing = Author.objects.filter(user__username__startswith=prefix)
+    have = existing.count()
+    roles = ("reporter",) * 6 + ("editor",) * 3 + ("admin",)
+
+    users = User.objects.bulk_create([
+        User(username=f"{prefix}-{i}", first_name="Synthetic", last_name=f"Author {i}",
+             password="!")  # unusable password
+        for i in range(have, count)
+    ])
+    if users:
+        # bulk_create only returns primary keys on some backends.
+        users = User.objects.filter(username__in=[u.username for u in users])
+        rng = random.Random(have)
+        Author.objects.bulk_create([
+            Author(user=user, name=user.get_full_name(), role=rng.choice(roles),
+                   bio=" ".join(sentence(rng) for _ in range(3)))
+            for user in users
+        ])
+    return list(existing)
+
+
+def bulk_articles(count, categories, authors=(), words=250, status="published",
+                  seed=0, start=0, slug_prefix="synthetic", batch_size=2000):
+    """
+    Insert ``count`` articles; returns the number written.
+
+    Slugs are ``<slug_prefix>-<n>`` from ``start``: repeated calls offset
+    ``start``, separate callers pass their own ``slug_prefix``.
+    """
+    rng = random.Random(seed + start)
+    authors = list(authors) or [None]
+    written = 0
+
+    while written < count:
+        batch = []
+        for i in range(start + written, start + min(count, written + batch_size)):
+            content = paragraph(rng, rng.randint(words // 2, words * 3 // 2))
+            title = sentence(rng, 5, 12)[:-1]
+            summary = sentence(rng, 15, 30)
+            batch.append(NewsArticle(
+                title=title,
+                slug=f"{slug_prefix}-{i}",
+                summary=summary,
+                content=content,
+                seo_title=title,
+                seo_description=summary[:160],
+                category=rng.choice(categories),
+                author=rng.choice(authors),
+                status=status,
+                is_featured=rng.random() < 0.05,
+                is_breaking=rng.random() < 0.02,
+                reading_time=max(1, content.count(" ") // 200),
+            ))
+        NewsArticle.objects.bulk_create(batch)
+        written += len(batch)
+
+    return written
+
+
+def bulk_gallery_images(articles, per_article=3, seed=0, batch_size=2000):
+    """
+    Attach 0..``per_article`` gallery rows to each article; returns the
+    number written. Images are storage names only, no files are uploaded.
+    """
+    rng = random.Random(seed)
+    batch, written = [], 0
+    for article in articles:
+        for order in range(rng.randint(0, per_article)):
+            batch.append(GalleryImage(
+                article_id=article.pk,
+                image=f"news/gallery/{article.slug}-{order}.jpg",
+                caption=sentence(rng, 4, 10)[:255],
+                order=order,
+            ))
+        if len(batch) >= batch_size:
+            GalleryImage.objects.bulk_create(batch)
+            written += len(batch)
+            batch = []
+
+    GalleryImage.objects.bulk_create(batch)
+    return written + len(batch)
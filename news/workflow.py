@@ -0,0 +1,151 @@
+"""
+Bulk editorial workflow: submit, publish or delete many articles at once,
+and publish whatever is scheduled and due (``publish_due``).
+
+Each action applies the same rules as its single-article endpoint
+(SubmitForReviewAPI, PublishArticleAPI, NewsUpdateDeleteAPI.delete), but
+as one SELECT plus one set-based UPDATE or DELETE inside a transaction.
+Querysets skip the model signals, so the signal work (category counters,
+list cards, cache invalidation, related index) is done here once per
+batch.
+"""
+
+from collections import Counter, namedtuple
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from categories.models import Category
+from .cards import refresh_cards
+from .models import NewsArticle, GalleryImage, RelatedArticle
+from .related import schedule_add_many
+from .signals import ArticleState, invalidate_article_states
+
+
+# Upper bound on slugs per request.
+MAX_SLUGS = 200
+
+Action = namedtuple("Action", "roles own_only from_statuses to_status refusal")
+
+ACTIONS = {
+    # Reporters submit their own drafts.
+    "submit": Action(
+        None, True, ("draft",), "review", "Only draft articles can be submitted",
+    ),
+    # Scheduled articles can also be published ahead of time.
+    "publish": Action(
+        ("admin", "editor"), False, ("review", "scheduled"), "published",
+        "Only reviewed articles can be published",
+    ),
+    "delete": Action(("admin",), False, None, None, None),
+}
+
+# Run by the scheduler (manage.py publish_scheduled), not through the API.
+SCHEDULED = Action(None, False, ("scheduled",), "published", None)
+
+
+def allowed(action, author):
+    roles = ACTIONS[action].roles
+    return roles is None or author.role in roles
+
+
+def apply(action, slugs, author):
+    """
+    Run ``action`` on ``slugs`` for ``author``; returns one result per slug:
+    {"slug", "result": "ok" | "not_found" | "skipped", "detail"?}.
+    """
+    rule = ACTIONS[action]
+    slugs = list(dict.fromkeys(slugs))
+
+    with transaction.atomic():
+        rows = NewsArticle.objects.select_for_update().filter(slug__in=slugs)
+        if rule.own_only:
+            rows = rows.filter(author=author)
+        found = {}
+        for pk, *fields in rows.values_list("pk", *ArticleState._fields):
+            state = ArticleState(*fields)
+            found[state.slug] = (pk, state)
+
+        results, targets = [], {}
+        for slug in slugs:
+            if slug not in found:
+                results.append({"slug": slug, "result": "not_found"})
+            elif rule.from_statuses and found[slug][1].status not in rule.from_statuses:
+                results.append({"slug": slug, "result": "skipped", "detail": rule.refusal})
+            else:
+                results.append({"slug": slug, "result": "ok"})
+                targets[found[slug][0]] = found[slug][1]
+
+        if targets:
+            if action == "delete":
+                _delete(targets)
+            else:
+                _transition(rule, targets)
+
+    return results
+
+
+def publish_due(now=None, limit=500):
+    """
+    Publish up to ``limit`` scheduled articles whose time has come, with
+    one indexed SELECT and one UPDATE, and the counters, cards and caches
+    refreshed once for the lot. Returns the number published.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        # skip_locked: a second scheduler process takes the next rows
+        # instead of waiting on these.
+        rows = (
+            NewsArticle.objects.select_for_update(skip_locked=True)
+            .filter(status="scheduled", scheduled_at__lte=now)
+            .order_by("scheduled_at", "id")
+            .values_list("pk", *ArticleState._fields)[:limit]
+        )
+        targets = {pk: ArticleState(*fields) for pk, *fields in rows}
+        if targets:
+            _transition(SCHEDULED, targets)
+    return len(targets)
+
+
+def _transition(rule, targets):
+    ids = list(targets)
+    now = timezone.now()
+    changes = {"status": rule.to_status, "updated_at": now}
+    if rule.to_status == "published":
+        # The real publish time, as NewsArticle.save() sets it.
+        changes.update(published_at=now, scheduled_at=None)
+    NewsArticle.objects.filter(pk__in=ids, status__in=rule.from_statuses).update(**changes)
+    after = [state._replace(status=rule.to_status) for state in targets.values()]
+
+    if rule.to_status == "published":
+        Category.adjust_published_counts(Counter(s.category_id for s in after))
+        refresh_cards(NewsArticle.objects.filter(pk__in=ids))
+        schedule_add_many(ids)
+    invalidate_article_states(
+        *targets.values(), *after, counts_changed=rule.to_status == "published"
+    )
+
+
+# Every foreign key into the tables _delete() empties, as (model, field).
+# _delete() bypasses Django's deletion collector, so it must name each one
+# itself; news/tests.py fails on a relation missing here instead of
+# leaving rows the DELETE can't remove.
+_CASCADES = {(GalleryImage, "article"), (RelatedArticle, "article"), (RelatedArticle, "related")}
+
+
+def _delete(targets):
+    ids = list(targets)
+    # QuerySet.delete() would load every row and cascade one model at a
+    # time to send per-row signals; delete the dependants directly (all
+    # of them: see _CASCADES).
+    for dependants in (
+        GalleryImage.objects.filter(article_id__in=ids),
+        RelatedArticle.objects.filter(Q(article_id__in=ids) | Q(related_id__in=ids)),
+        NewsArticle.objects.filter(pk__in=ids),
+    ):
+        dependants._raw_delete(dependants.db)
+
+    removed = Counter(s.category_id for s in targets.values() if s.status == "published")
+    Category.adjust_published_counts({pk: -n for pk, n in removed.items()})
+    invalidate_article_states(*targets.values(), counts_changed=True)
@@ -3,6 +3,12 @@ ASGI config for news_backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+    uvicorn news_backend.asgi:application --workers 2
+
+Serving through here turns on the async public views
+(ASYNC_PUBLIC_VIEWS, see news/async_views.py) unless DJANGO_ASYNC_VIEWS
+says otherwise.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
@@ -12,5 +18,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'news_backend.settings')
+os.environ.setdefault('DJANGO_ASYNC_VIEWS', 'True')
 
 application = get_asgi_application()
@@ -0,0 +1,243 @@
+"""
+Shared response cache for the public read endpoints.
+
+Every cached response belongs to one or more *namespaces*
+("news:list", "news:article:<slug>", "author:<id>" ...). Each namespace
+has a generation token; an entry is only served while the tokens it was
+stored with are still current. Invalidating a namespace replaces its
+token, which retires every entry under it without enumerating keys.
+
+Signal handlers in news/signals.py decide which namespaces a write
+touches; views only declare what they depend on.
+
+The tokens live in the cache backend, so they only retire entries in
+processes that share it: with API_CACHE_ENABLED off (the default for a
+process-local backend, see settings.py) the decorators call the view
+straight through.
+"""
+
+import hashlib
+from functools import wraps
+from uuid import uuid4
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+from news_backend.responses import JSONResponse
+
+
+CACHE_ALIAS = getattr(settings, "API_CACHE_ALIAS", "default")
+CACHE_TIMEOUT = getattr(settings, "API_CACHE_TIMEOUT", 300)
+
+_GEN_PREFIX = "api-gen:"
+_STATS_PREFIX = "api-stats:"
+
+# Names of every cached view, for the stats endpoint.
+registry = set()
+
+
+def get_cache():
+    return caches[CACHE_ALIAS]
+
+
+def enabled():
+    return getattr(settings, "API_CACHE_ENABLED", True)
+
+
+# -------------------------------------------------
+# Generations / invalidation
+# -------------------------------------------------
+def _generations(namespaces):
+    cache = get_cache()
+    keys = [_GEN_PREFIX + ns for ns in namespaces]
+    found = cache.get_many(keys)
+
+    gens = {}
+    for ns, key in zip(namespaces, keys):
+        gen = found.get(key)
+        if gen is None:
+            gen = uuid4().hex
+            if not cache.add(key, gen, None):
+                gen = cache.get(key, gen)
+        gens[ns] = gen
+    return gens
+
+
+def invalidate(*namespaces):
+    """Retire every cached response under ``namespaces`` (after commit)."""
+    namespaces = {ns for ns in namespaces if ns}
+    if not namespaces:
+        return
+
+    def bump():
+        get_cache().delete_many([_GEN_PREFIX + ns for ns in namespaces])
+
+    transaction.on_commit(bump)
+
+
+# -------------------------------------------------
+# Hit / miss counters
+# -------------------------------------------------
+def _record(view_name, outcome):
+    cache = get_cache()
+    key = f"{_STATS_PREFIX}{view_name}:{outcome}"
+    if not cache.add(key, 1, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, 1, None)
+
+
+def stats():
+    cache = get_cache()
+    keys = [
+        f"{_STATS_PREFIX}{name}:{outcome}"
+        for name in sorted(registry)
+        for outcome in ("hit", "miss")
+    ]
+    found = cache.get_many(keys)
+
+    views = {}
+    for name in sorted(registry):
+        hits = found.get(f"{_STATS_PREFIX}{name}:hit", 0)
+        misses = found.get(f"{_STATS_PREFIX}{name}:miss", 0)
+        total = hits + misses
+        views[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else None,
+        }
+    return views
+
+
+# -------------------------------------------------
+# View decorator
+# -------------------------------------------------
+def _normalize(name, values):
+    values = [" ".join(v.split()) for v in values]
+    if name == "q":
+        values = [v.lower() for v in values]
+    elif name == "page":
+        values = [v for v in values if v != "1"]
+    return sorted(v for v in values if v)
+
+
+def response_key(view_name, request, params, kwargs):
+    parts = [request.get_host(), repr(sorted(kwargs.items()))]
+    for name in params:
+        values = _normalize(name, request.GET.getlist(name))
+        if values:
+            parts.append(f"{name}={values!r}")
+    digest = hashlib.md5("|".join(parts).encode("utf-8")).hexdigest()
+    return f"api:{view_name}:{digest}"
+
+
+def _lookup(view_name, key, namespace):
+    """
+    ``(data, None, state)`` for a current entry, else ``(None,
+    generations, None)``: the tokens to store the fresh response with,
+    read before the view runs so that a write landing mid-request makes
+    the entry stale instead of lost. ``state`` is the conditional GET
+    validator's result stored with the entry (news_backend/conditional.py).
+    """
+    entry = get_cache().get(key)
+    if entry is not None and len(entry) == 3:  # older (data, gens) entries: a miss
+        data, stored, state = entry
+        if _generations(list(stored)) == stored:
+            _record(view_name, "hit")
+            return data, None, state
+
+    _record(view_name, "miss")
+    return None, _generations([namespace]), None
+
+
+def _store(key, data, gens, depends_on, state):
+    extra = list(depends_on(data)) if depends_on else []
+    if extra:
+        gens.update(_generations(extra))
+    get_cache().set(key, (data, gens, state), CACHE_TIMEOUT)
+
+
+def cached_response(namespace, params=(), depends_on=None):
+    """
+    Cache a view method's successful responses.
+
+    namespace   format string filled from the URL kwargs,
+                e.g. "news:category:{category_slug}".
+    params      query params that change the response; all others are
+                ignored, so cache-busting junk does not fragment the cache.
+    depends_on  optional callable(data) -> extra namespaces, for responses
+                that embed other objects (an article's author, ...).
+
+    A conditional_get() applied on top sets ``wrapper.validator``: it runs
+    with the view on a miss and its result is kept with the entry, as
+    ``response.validator_state``.
+    """
+    def decorator(method):
+        view_name = method.__qualname__.split(".")[0]
+        registry.add(view_name)
+
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            if not enabled():
+                return method(view, request, *args, **kwargs)
+
+            key = response_key(view_name, request, params, kwargs)
+            data, gens, state = _lookup(view_name, key, namespace.format(**kwargs))
+            if gens is None:
+                response = Response(data)
+                response["X-Cache"] = "HIT"
+            else:
+                # Before the view, like the generations.
+                state = wrapper.validator(request, **kwargs) if wrapper.validator else None
+                response = method(view, request, *args, **kwargs)
+                if response.status_code == 200:
+                    _store(key, response.data, gens, depends_on, state)
+                response["X-Cache"] = "MISS"
+            response.validator_state = state
+            return response
+
+        wrapper.cached = True
+        wrapper.validator = None
+        return wrapper
+    return decorator
+
+
+def acached_response(namespace, params=(), depends_on=None):
+    """
+    cached_response() for async view methods returning a JSONResponse
+    (news_backend/responses.py). Entries are shared with the sync view
+    of the same name.
+    """
+    def decorator(method):
+        view_name = method.__qualname__.split(".")[0]
+        registry.add(view_name)
+
+        @wraps(method)
+        async def wrapper(view, request, *args, **kwargs):
+            if not enabled():
+                return await method(view, request, *args, **kwargs)
+
+            key = response_key(view_name, request, params, kwargs)
+            data, gens, state = await sync_to_async(_lookup)(
+                view_name, key, namespace.format(**kwargs)
+            )
+            if gens is None:
+                response = JSONResponse(data)
+                response["X-Cache"] = "HIT"
+            else:
+                state = await wrapper.validator(request, **kwargs) if wrapper.validator else None
+                response = await method(view, request, *args, **kwargs)
+                if response.status_code == 200:
+                    await sync_to_async(_store)(key, response.data, gens, depends_on, state)
+                response["X-Cache"] = "MISS"
+            response.validator_state = state
+            return response
+
+        wrapper.cached = True
+        wrapper.validator = None
+        return wrapper
+    return decorator
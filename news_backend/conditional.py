@@ -0,0 +1,126 @@
+"""
+Conditional GET (ETag / Last-Modified) for the public read endpoints.
+
+Each view supplies a *validator*: a cheap query returning a fingerprint
+of everything its response is built from, plus the newest modification
+time. A client that sends back a matching ``If-None-Match`` (or a recent
+enough ``If-Modified-Since``) gets a 304 before the view, the response
+cache or any serializer runs.
+
+Apply outside ``cached_response``. With the shared response cache on,
+the validator runs only when a response is built: its result is stored
+with the cache entry, so a hit is answered (200 or 304) without a
+single query. Without the cache, the validator runs first and a match
+returns before the view.
+"""
+
+import hashlib
+from calendar import timegm
+from functools import wraps
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from news_backend.cache import enabled as cache_enabled
+
+
+def make_etag(request, fingerprint):
+    # The URL and Accept header are part of the representation: pages,
+    # limits and the browsable API must not share a validator.
+    parts = [
+        request.get_full_path(),
+        request.META.get("HTTP_ACCEPT", ""),
+        repr(fingerprint),
+    ]
+    digest = hashlib.md5("|".join(parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _validate(request, state):
+    """``(etag, timestamp, 304 response or None)`` for a validator's state."""
+    fingerprint, last_modified = state
+    etag = make_etag(request, fingerprint)
+    timestamp = timegm(last_modified.utctimetuple()) if last_modified else None
+    return etag, timestamp, get_conditional_response(
+        request, etag=etag, last_modified=timestamp
+    )
+
+
+def _stamp(response, etag, timestamp):
+    response["ETag"] = etag
+    if timestamp is not None:
+        response["Last-Modified"] = http_date(timestamp)
+    # Without an explicit policy, Last-Modified invites heuristic
+    # caching; news must be revalidated on every use instead.
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def _respond(request, response, state):
+    # A response from cached_response(), with the validator state that
+    # was stored alongside it.
+    if state is None or response.status_code != 200:
+        return response
+    etag, timestamp, not_modified = _validate(request, state)
+    return _stamp(not_modified or response, etag, timestamp)
+
+
+def conditional_get(validator):
+    """
+    Answer conditional GETs for a view method.
+
+    validator  callable(request, **url_kwargs) -> (fingerprint, last_modified)
+               or None when there is nothing to validate (the view then
+               runs as usual, e.g. to return its 404).
+    """
+    def decorator(method):
+        # A cached_response() directly beneath runs it on a miss.
+        method.validator = validator
+        cached = getattr(method, "cached", False)
+
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            if cached and cache_enabled():
+                response = method(view, request, *args, **kwargs)
+                return _respond(request, response, getattr(response, "validator_state", None))
+
+            state = validator(request, **kwargs)
+            if state is None:
+                return method(view, request, *args, **kwargs)
+
+            etag, timestamp, response = _validate(request, state)
+            if response is None:
+                response = method(view, request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            return _stamp(response, etag, timestamp)
+
+        return wrapper
+    return decorator
+
+
+def aconditional_get(validator):
+    """conditional_get() for async view methods; ``validator`` is async too."""
+    def decorator(method):
+        method.validator = validator
+        cached = getattr(method, "cached", False)
+
+        @wraps(method)
+        async def wrapper(view, request, *args, **kwargs):
+            if cached and cache_enabled():
+                response = await method(view, request, *args, **kwargs)
+                return _respond(request, response, getattr(response, "validator_state", None))
+
+            state = await validator(request, **kwargs)
+            if state is None:
+                return await method(view, request, *args, **kwargs)
+
+            etag, timestamp, response = _validate(request, state)
+            if response is None:
+                response = await method(view, request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            return _stamp(response, etag, timestamp)
+
+        return wrapper
+    return decorator
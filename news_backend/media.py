@@ -0,0 +1,37 @@
+"""
+Media URLs without going through the storage backend.
+
+With AWS_QUERYSTRING_AUTH off, every S3 URL we serve is MEDIA_URL plus
+the stored name, yet ``FieldFile.url`` runs botocore's URL machinery per
+call. Serializers use ``media_url()`` instead: a string concatenation.
+
+Two exceptions keep it honest. A file still staged for upload
+(news_backend/storage.py) gets the placeholder URL, as ``url()`` would
+give. MEDIA_URLS_FROM_STORAGE = True switches back to ``storage.url()``
+everywhere, e.g. for signed URLs or a bucket not behind MEDIA_URL.
+"""
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.utils.encoding import filepath_to_uri
+
+
+def media_url(file, storage=None):
+    """
+    URL of a FieldFile (or a stored name in ``storage``); None if empty.
+    """
+    name = getattr(file, "name", file)
+    if not name:
+        return None
+    storage = storage or getattr(file, "storage", default_storage)
+
+    if getattr(settings, "MEDIA_URLS_FROM_STORAGE", False):
+        try:
+            return storage.url(name)
+        except Exception:
+            return None
+
+    is_pending = getattr(storage, "is_pending", None)
+    if is_pending is not None and is_pending(name):
+        return settings.STAGED_UPLOAD_PLACEHOLDER_URL
+    return f"{settings.MEDIA_URL}{filepath_to_uri(name)}"
@@ -0,0 +1,180 @@
+"""
+Per-request SQL and timing instrumentation.
+
+RequestMetricsMiddleware counts the queries a request runs and how long
+they take, times serialization (model instances into ``response.data``:
+compiled serializers and list cards, which wrap themselves in
+``timed("serialize")``) and rendering (``response.data`` into bytes, by
+DRF or by JSONResponse) and reports them:
+
+- a ``Server-Timing`` header (db / serialize / render / total), visible
+  in browser dev tools, unless SERVER_TIMING_HEADER is off;
+- one JSON log line per request on the "news_backend.requests" logger.
+
+A view may declare ``query_budget = <n>`` (on the APIView class or the
+view function); requests that run more queries log a warning, which is
+how N+1s get noticed before they become slow pages.
+"""
+
+import json
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger("news_backend.requests")
+
+# Stage name -> [seconds, open sections] for the request being handled.
+# sync_to_async copies the context, not the dict, so time spent on a
+# worker thread is added to the request that started it.
+_stages = ContextVar("request_stages", default=None)
+
+
+@contextmanager
+def timed(stage):
+    """
+    Add the enclosed block's wall time to ``stage`` of the current request.
+
+    Nested blocks of the same stage count once; outside a request (no
+    middleware, management commands) this does nothing.
+    """
+    stages = _stages.get()
+    if stages is None:
+        yield
+        return
+    timer = stages.setdefault(stage, [0.0, 0])
+    timer[1] += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer[1] -= 1
+        if not timer[1]:
+            timer[0] += time.perf_counter() - start
+
+
+class QueryMetrics:
+    """execute_wrapper that counts queries and sums their wall time."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.header = getattr(settings, "SERVER_TIMING_HEADER", True)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        queries = QueryMetrics()
+        request._metrics_render = [None, None]
+        stages = {}
+        token = _stages.set(stages)
+        start = time.perf_counter()
+
+        try:
+            with self._instrument(queries):
+                response = self.get_response(request)
+        finally:
+            _stages.reset(token)
+        return self._report(request, response, queries, stages, start)
+
+    async def __acall__(self, request):
+        queries = QueryMetrics()
+        request._metrics_render = [None, None]
+        stages = {}
+        token = _stages.set(stages)
+        start = time.perf_counter()
+
+        # Under ASGI the request's queries run on its sync_to_async
+        # thread, with that thread's connections: instrument them there.
+        stack = await sync_to_async(self._instrument)(queries)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+            _stages.reset(token)
+        return self._report(request, response, queries, stages, start)
+
+    @staticmethod
+    def _instrument(queries):
+        stack = ExitStack()
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(queries))
+        return stack
+
+    def _report(self, request, response, queries, stages, start):
+        total = time.perf_counter() - start
+        render_start, render_end = request._metrics_render
+        render = render_end - render_start if render_end else 0.0
+        render += stages.get("render", (0.0,))[0]
+        serialize = stages.get("serialize", (0.0,))[0]
+
+        if self.header:
+            response["Server-Timing"] = ", ".join([
+                f'db;dur={queries.seconds * 1000:.1f};desc="{queries.count} queries"',
+                f"serialize;dur={serialize * 1000:.1f}",
+                f"render;dur={render * 1000:.1f}",
+                f"total;dur={total * 1000:.1f}",
+            ])
+
+        view = getattr(request, "_metrics_view", None)
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "view": view,
+            "queries": queries.count,
+            "db_ms": round(queries.seconds * 1000, 2),
+            "serialize_ms": round(serialize * 1000, 2),
+            "render_ms": round(render * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+        }
+        logger.info(json.dumps(record))
+
+        budget = getattr(request, "_metrics_budget", None)
+        if budget is not None and queries.count > budget:
+            logger.warning(
+                "%s ran %d queries (budget %d): %s %s",
+                view, queries.count, budget, request.method, request.path,
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, "view_class", view_func)
+        request._metrics_view = f"{view.__module__}.{view.__qualname__}"
+        request._metrics_budget = getattr(view, "query_budget", None)
+
+    def process_template_response(self, request, response):
+        # DRF responses render after the view returns; time that step.
+        timer = request._metrics_render
+        timer[0] = time.perf_counter()
+
+        def rendered(response):
+            timer[1] = time.perf_counter()
+
+        response.add_post_render_callback(rendered)
+        return response
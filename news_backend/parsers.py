@@ -0,0 +1,43 @@
+"""
+orjson-backed JSON parsing for the API (REST_FRAMEWORK in settings.py).
+"""
+
+import codecs
+import re
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.utils import json
+
+from news_backend.renderers import ORJSONRenderer
+
+
+# orjson reads integers beyond 64 bits as floats rather than failing, so
+# a body with a run this long may hold one and goes to the stdlib parser,
+# which keeps it exact. Long digit runs inside strings just parse slower.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser on orjson. Like STRICT_JSON, NaN and Infinity are rejected.
+    Bodies that may hold integers beyond 64 bits use the stdlib parser.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            body = stream.read()
+            if codecs.lookup(encoding).name != "utf-8":
+                body = body.decode(encoding).encode()
+            if _LONG_DIGITS.search(body):
+                return json.loads(body, parse_constant=json.strict_constant)
+            return orjson.loads(body)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
@@ -0,0 +1,85 @@
+"""
+orjson-backed JSON rendering for the API (REST_FRAMEWORK in settings.py).
+
+ORJSONRenderer writes the same bytes as DRF's JSONRenderer with the
+default settings (UTF-8, compact, "Z" for UTC, U+2028/U+2029 escaped),
+several times faster. orjson encodes the common types itself and hands
+the rest (Decimal, lazy translation strings, timedelta, QuerySet ...) to
+DRF's JSONEncoder.default, so they come out as DRF writes them.
+
+Anything orjson cannot encode (integers beyond 64 bits, a value
+JSONEncoder.default rejects) goes through JSONRenderer instead, as do
+indented output (``Accept: application/json; indent=4``, the browsable
+API) and non-default UNICODE_JSON / COMPACT_JSON settings. Known
+differences: NaN and infinities render as null rather than raising, and
+floats use orjson's shortest form (1e16, not 1e+16).
+
+RawJSON wraps JSON text that was rendered earlier (the stored list
+cards, news/cards.py). ORJSONRenderer copies it into the output as is;
+the JSONRenderer fallback decodes it first.
+"""
+
+import json
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class RawJSON:
+    """JSON text (str or bytes) to be spliced into a response verbatim."""
+
+    __slots__ = ("json",)
+
+    def __init__(self, json):
+        self.json = json
+
+    def __repr__(self):
+        return f"RawJSON({self.json!r})"
+
+
+class RawJSONEncoder(JSONEncoder):
+    """DRF's encoder, decoding RawJSON (for the JSONRenderer fallback)."""
+
+    def default(self, obj):
+        if isinstance(obj, RawJSON):
+            return json.loads(obj.json)
+        return super().default(obj)
+
+
+_encode = JSONEncoder().default
+
+
+def _default(obj):
+    if isinstance(obj, RawJSON):
+        return orjson.Fragment(obj.json)
+    return _encode(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    encoder_class = RawJSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Keep the output a strict JavaScript subset, as JSONRenderer does.
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
@@ -0,0 +1,29 @@
+"""
+Responses for the async public views (news/async_views.py), which run
+outside DRF's APIView.
+"""
+
+from django.http import HttpResponse
+from rest_framework.settings import api_settings
+
+from news_backend.middleware import timed
+
+
+class JSONResponse(HttpResponse):
+    """
+    ``data`` rendered by the first DEFAULT_RENDERER_CLASSES renderer: the
+    same bytes the matching APIView sends for ``Accept: application/json``.
+    Keeps ``data`` for the response cache, like a DRF Response.
+    """
+
+    def __init__(self, data, status=200, **kwargs):
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        with timed("render"):
+            content = renderer.render(data)
+        super().__init__(
+            content,
+            content_type=renderer.media_type,
+            status=status,
+            **kwargs,
+        )
+        self.data = data
@@ -0,0 +1,146 @@
+"""
+Compiled read-only serializers for the public endpoints.
+
+A DRF serializer works out per instance (per row, with ``many=True``)
+which fields it has, how to fetch each attribute and how to represent
+it, and it builds a serializer for every nested object. For output only,
+all of that can be decided once per class:
+
+    read_article = compiled(NewsDetailSerializer)
+    read_article(article)          # == NewsDetailSerializer(article).data
+    read_article.many(articles)    # == NewsDetailSerializer(articles, many=True).data
+
+``compiled()`` turns each readable field into a precomputed accessor:
+attribute lookups become ``operator.attrgetter``; CharField, IntegerField
+and BooleanField representation becomes ``str`` / ``int`` / ``bool``;
+SerializerMethodFields call the method on one serializer instance bound
+at compile time; nested serializers, including ``many=True`` ones, are
+compiled too. Every other field keeps its own ``to_representation()``,
+and fields with their own ``get_attribute()`` (related fields) are read
+exactly as DRF reads them. None is passed through unconverted, as
+Serializer.to_representation() does, so the output renders to the same
+JSON bytes as ``.data`` (news/tests.py checks each public serializer).
+
+Limits: input is model instances, not ``values()`` dicts (the media URL
+fields need the FieldFile and its storage); serializers are compiled
+without a context, so a field or method that reads ``self.context``
+cannot use this path; and callable attributes are not called.
+"""
+
+from functools import cache
+from operator import attrgetter
+
+from django.db.models.manager import BaseManager
+from rest_framework import fields as drf_fields
+from rest_framework.relations import PKOnlyObject
+from rest_framework.serializers import BaseSerializer, ListSerializer, SerializerMethodField
+
+from news_backend.middleware import timed
+
+
+# Field classes whose to_representation() is exactly one of these
+# builtins for the values a model hands over.
+_BUILTIN_REPRESENTATIONS = {
+    drf_fields.CharField.to_representation: str,
+    drf_fields.IntegerField.to_representation: int,
+    drf_fields.BooleanField.to_representation: bool,
+}
+
+
+def _plain(get, represent):
+    def read(obj):
+        value = get(obj)
+        return None if value is None else represent(value)
+    return read
+
+
+def _nested(get, read_item):
+    def read(obj):
+        value = get(obj)
+        return None if value is None else read_item(value)
+    return read
+
+
+def _nested_many(get, read_item):
+    def read(obj):
+        value = get(obj)
+        if value is None:
+            return None
+        if isinstance(value, BaseManager):
+            value = value.all()
+        return [read_item(item) for item in value]
+    return read
+
+
+def _as_drf(field):
+    # Related fields and others with their own get_attribute(), as
+    # Serializer.to_representation() calls them.
+    def read(obj):
+        value = field.get_attribute(obj)
+        check = value.pk if isinstance(value, PKOnlyObject) else value
+        return None if check is None else field.to_representation(value)
+    return read
+
+
+def _accessor(field):
+    if isinstance(field, SerializerMethodField):
+        # source="*": the method gets the instance itself.
+        return getattr(field.parent, field.method_name)
+
+    if type(field).get_attribute is not drf_fields.Field.get_attribute:
+        return _as_drf(field)
+
+    if field.source == "*":
+        get = lambda obj: obj  # noqa: E731
+    else:
+        get = attrgetter(".".join(field.source_attrs))
+
+    if isinstance(field, ListSerializer):
+        return _nested_many(get, _compile(field.child))
+    if isinstance(field, BaseSerializer):
+        return _nested(get, _compile(field))
+
+    method = type(field).to_representation
+    return _plain(get, _BUILTIN_REPRESENTATIONS.get(method) or field.to_representation)
+
+
+def _compile(serializer):
+    accessors = tuple(
+        (field.field_name, _accessor(field)) for field in serializer._readable_fields
+    )
+
+    def read(obj):
+        return {name: get(obj) for name, get in accessors}
+
+    return read
+
+
+class CompiledSerializer:
+    """Output of ``serializer_class`` for one instance, or ``.many()``."""
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self._read = None
+
+    def __call__(self, instance):
+        with timed("serialize"):
+            return (self._read or self._build())(instance)
+
+    def many(self, instances):
+        read = self._read or self._build()
+        if isinstance(instances, BaseManager):
+            instances = instances.all()
+        with timed("serialize"):
+            return [read(instance) for instance in instances]
+
+    def _build(self):
+        # On first use rather than at import: binding a ModelSerializer's
+        # fields needs the app registry.
+        self._read = _compile(self.serializer_class())
+        return self._read
+
+
+@cache
+def compiled(serializer_class):
+    """The (shared) CompiledSerializer for ``serializer_class``."""
+    return CompiledSerializer(serializer_class)
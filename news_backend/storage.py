@@ -0,0 +1,138 @@
+"""
+Staged uploads: write to local disk now, push to object storage later.
+
+StagedStorage is the default storage. ``save()`` writes the upload under
+STAGED_UPLOAD_ROOT and, once the transaction commits, hands the push to
+the background pool (news_backend/tasks.py), which copies it to the
+"remote" storage (S3 in production) with retries and then deletes the
+staged copy. Until then ``url()`` returns STAGED_UPLOAD_PLACEHOLDER_URL,
+so the article is usable straight away and no request waits on S3.
+
+``upload_finished`` is sent after each push, so whoever rendered the
+placeholder (news/signals.py) can refresh. Files whose push gave up are
+retried by ``manage.py push_staged_uploads``.
+
+Only the worker that staged a file can serve or push it: STAGED_UPLOAD_ROOT
+must be local to the host, and a host should not be retired with files
+still staged.
+"""
+
+import logging
+import os
+import time
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, Storage, storages
+from django.dispatch import Signal
+from django.utils.functional import cached_property
+
+from news_backend.tasks import submit_on_commit
+
+
+logger = logging.getLogger(__name__)
+
+# Sent with ``name`` once a staged file is in remote storage.
+upload_finished = Signal()
+
+
+class StagedStorage(Storage):
+
+    def __init__(self, location=None, remote=None):
+        self._location = location
+        self._remote = remote
+
+    @cached_property
+    def staging(self):
+        return FileSystemStorage(
+            location=self._location or settings.STAGED_UPLOAD_ROOT, base_url=None
+        )
+
+    @property
+    def remote(self):
+        return storages[self._remote or getattr(settings, "STAGED_REMOTE_STORAGE", "remote")]
+
+    # -------------------------------------------------
+    # Storage API
+    # -------------------------------------------------
+    def _save(self, name, content):
+        name = self.staging.save(name, content)
+        submit_on_commit(self.push, name)
+        return name
+
+    def _open(self, name, mode="rb"):
+        try:
+            return self.staging.open(name, mode)
+        except FileNotFoundError:  # pushed (or never staged here)
+            return self.remote.open(name, mode)
+
+    def get_available_name(self, name, max_length=None):
+        # Checking the remote store would put a round trip back on the
+        # request path; a random suffix makes a remote clash negligible.
+        dir_name, file_name = os.path.split(name)
+        file_root, file_ext = os.path.splitext(file_name)
+        name = os.path.join(dir_name, self.get_alternative_name(file_root, file_ext))
+        return self.staging.get_available_name(name, max_length=max_length)
+
+    def exists(self, name):
+        return self.staging.exists(name) or self.remote.exists(name)
+
+    def delete(self, name):
+        if self.staging.exists(name):
+            self.staging.delete(name)
+        self.remote.delete(name)
+
+    def size(self, name):
+        if self.staging.exists(name):
+            return self.staging.size(name)
+        return self.remote.size(name)
+
+    def url(self, name):
+        if self.is_pending(name):
+            return settings.STAGED_UPLOAD_PLACEHOLDER_URL
+        return self.remote.url(name)
+
+    # -------------------------------------------------
+    # Staging
+    # -------------------------------------------------
+    def is_pending(self, name):
+        """True while ``name`` is staged locally and not yet pushed."""
+        return bool(name) and self.staging.exists(name)
+
+    def pending(self):
+        """Names of every staged file, oldest first."""
+        root = self.staging.location
+        found = []
+        for directory, _, files in os.walk(root):
+            for file_name in files:
+                path = os.path.join(directory, file_name)
+                found.append((os.path.getmtime(path), os.path.relpath(path, root)))
+        return [name.replace(os.sep, "/") for _, name in sorted(found)]
+
+    def push(self, name):
+        """
+        Copy a staged file to remote storage, retrying with exponential
+        backoff (STAGED_UPLOAD_RETRIES, STAGED_UPLOAD_RETRY_DELAY).
+        Returns True once pushed; on failure the file stays staged.
+        """
+        attempts = getattr(settings, "STAGED_UPLOAD_RETRIES", 5)
+        delay = getattr(settings, "STAGED_UPLOAD_RETRY_DELAY", 2.0)
+
+        for attempt in range(attempts):
+            if not self.staging.exists(name):
+                return False  # pushed by someone else, or deleted
+            try:
+                with self.staging.open(name, "rb") as content:
+                    saved = self.remote.save(name, content)
+                break
+            except Exception:
+                if attempt + 1 == attempts:
+                    logger.exception("upload of %s failed %d times; left staged", name, attempts)
+                    return False
+                logger.warning("upload of %s failed, retrying", name, exc_info=True)
+                time.sleep(delay * 2 ** attempt)
+
+        if saved != name:
+            logger.error("remote storage renamed %s to %s", name, saved)
+        self.staging.delete(name)
+        upload_finished.send(sender=type(self), name=name)
+        return True
@@ -0,0 +1,73 @@
+"""
+In-process background worker pool.
+
+Work that must not hold up a request (image variants, uploads to object
+storage) is handed to a small thread pool, normally after the current
+transaction commits. Tasks live in memory only: whatever a restart
+drops is picked up by the management command that backfills that kind
+of work (e.g. build_image_variants).
+
+BACKGROUND_WORKERS = 0 runs every task inline, which is what tests and
+management commands want.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_lock = threading.Lock()
+
+
+def workers():
+    return getattr(settings, "BACKGROUND_WORKERS", 2)
+
+
+def _pool():
+    # Created on first use, so forked server workers each get their own.
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=workers(), thread_name_prefix="background"
+            )
+        return _executor
+
+
+def _run(fn, args, kwargs, inline):
+    try:
+        return fn(*args, **kwargs)
+    except Exception:
+        logger.exception("background task %s failed", fn.__qualname__)
+    finally:
+        if not inline:
+            # Pool threads open their own connections; don't leak them.
+            connections.close_all()
+
+
+def submit(fn, *args, **kwargs):
+    """Run ``fn(*args, **kwargs)`` in the pool; returns a Future (None inline)."""
+    if workers() <= 0:
+        _run(fn, args, kwargs, inline=True)
+        return None
+    return _pool().submit(_run, fn, args, kwargs, False)
+
+
+def submit_on_commit(fn, *args, using=None, **kwargs):
+    """submit() once the current transaction commits (immediately if none)."""
+    transaction.on_commit(lambda: submit(fn, *args, **kwargs), using=using)
+
+
+def wait():
+    """Block until every queued task has finished (tests, shutdown)."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from django.http import JsonResponse
@@ -110,3 +112,7 @@ urlpatterns = [
     path("api/news/", include("news.api_urls")),
     path("api/authors/", include("authors.api_urls")),
 ]
+
+# Local media storage (DJANGO_MEDIA_STORAGE=local); a no-op unless DEBUG.
+if settings.MEDIA_ROOT:
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)